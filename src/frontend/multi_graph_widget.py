@@ -43,6 +43,7 @@ class GraphWidget(QWidget):
         self.graph_id = graph_id
         self.variables = variables or []
         self._direct_export_handled = False  # Flag to prevent duplicate export calls
+        self._signals_connected = False  # Set once ResultsTabSuite has connected its slots
         
         # Key change: Use Fixed policy for vertical sizing to ensure it never resizes
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -1,22 +1,27 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, 
     QComboBox, QFileDialog, QLabel, QListWidget, QListWidgetItem, 
-    QCheckBox, QGroupBox, QSplitter, QScrollArea, QProgressDialog
+    QGroupBox, QSplitter, QProgressDialog
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
 import os
 import json
 import csv
-import random
+import time
 from PyQt5.QtWidgets import QApplication
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.gridspec import GridSpec
+from matplotlib.lines import Line2D
+import matplotlib.colors as mcolors
 import math
-from math import exp  # For channel dependency calculations
+import bisect
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from .multi_graph_widget import MultiGraphWidget
 from .. import app_settings
@@ -26,6 +31,260 @@ def debug_print(*args, **kwargs):
     if app_settings.DEBUG_LOGGING:
         print(*args, **kwargs)
 
+# One loaded series in update_specific_graph - attribute access avoids per-field dict lookups
+PlotEntry = namedtuple('PlotEntry', 'sim_hash label x_data y_data y_min y_max')
+
+# Colors for different simulations, parsed to RGBA once instead of per plotted line
+_COLORS_HEX = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+               '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')
+_COLORS_RGBA = np.asarray([mcolors.to_rgba(c) for c in _COLORS_HEX], dtype=np.float32)
+
+# (line style, marker) for each position within a group of similar plots: the line style
+# cycles first, then the marker, so the table repeats every 4 * 7 entries
+_GROUP_MEMBER_STYLES = tuple((line_style, marker)
+                             for marker in ['', 'o', 's', '^', 'x', 'D', '+']
+                             for line_style in ['-', '--', '-.', ':'])
+
+class _ArrayCache:
+    """Least-recently-used store of loaded history arrays, bounded by their total size in bytes
+    
+    Keys start with the simulation hash. Any value with an nbytes attribute can be stored,
+    which is how ResultsTabSuite also keeps its plot-ready _PlotPair entries in one.
+    """
+    
+    def __init__(self, max_bytes=512 << 20):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._arrays = OrderedDict()  # (sim_hash, var_name) -> array, oldest first
+    
+    def __contains__(self, key):
+        return key in self._arrays
+    
+    def get(self, key):
+        """Return the cached array for key (or None) and mark it as recently used"""
+        data = self._arrays.get(key)
+        if data is not None:
+            self._arrays.move_to_end(key)
+        return data
+    
+    def put(self, key, data):
+        """Store an array, evicting the least recently used ones to stay within the byte budget"""
+        self.pop(key)
+        while self._arrays and self.current_bytes + data.nbytes > self.max_bytes:
+            _, evicted = self._arrays.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+        self._arrays[key] = data
+        self.current_bytes += data.nbytes
+    
+    def pop(self, key):
+        data = self._arrays.pop(key, None)
+        if data is not None:
+            self.current_bytes -= data.nbytes
+        return data
+    
+    def clear_except(self, keep_sims, keep_vars=()):
+        """Drop arrays of simulations not in keep_sims, except variables in keep_vars; returns the count"""
+        dropped = [key for key in self._arrays if key[0] not in keep_sims and key[1] not in keep_vars]
+        for key in dropped:
+            self.pop(key)
+        return len(dropped)
+    
+    def clear(self):
+        self._arrays.clear()
+        self.current_bytes = 0
+
+class _PlotPair(namedtuple('_PlotPair', 'x_data y_data y_min y_max x_source y_source')):
+    """Plot-ready float32 arrays of one (simulation, x variable, y variable) pair and the y range,
+    plus the full-precision arrays they were converted from (used for exports)"""
+    __slots__ = ()
+    
+    @property
+    def nbytes(self):
+        """Size of the arrays, so pairs can be kept in an _ArrayCache"""
+        total = self.x_source.nbytes + self.y_source.nbytes
+        for data, source in ((self.x_data, self.x_source), (self.y_data, self.y_source)):
+            # The float32 conversion is skipped for data that already is float32
+            if not np.may_share_memory(data, source):
+                total += data.nbytes
+        return total
+
+class _HistoryLoaderSignals(QObject):
+    """Signals for _HistoryLoadJob (QRunnable can't define its own)"""
+    data_ready = pyqtSignal(int, str, str, object)  # request id, sim_hash, var_name, array or None
+
+class _HistoryLoadJob(QRunnable):
+    """Reads one history file on the thread pool and reports the array back to the GUI thread"""
+    
+    def __init__(self, signals, request_id, sim_hash, var_name, history_file):
+        super().__init__()
+        self.signals = signals
+        self.request_id = request_id
+        self.sim_hash = sim_hash
+        self.var_name = var_name
+        self.history_file = history_file
+    
+    def run(self):
+        try:
+            data = ResultsTabSuite._read_history_file(self.history_file)
+        except Exception as e:
+            debug_print(f"Error loading {self.var_name} in background: {str(e)}")
+            data = None
+        self.signals.data_ready.emit(self.request_id, self.sim_hash, self.var_name, data)
+
+def _plot_sample_indices(length, target=5000):
+    """Evenly spaced indices, first and last included, for sampling a history down to target points.
+    
+    Unlike a plain stride this always keeps the final value and gives every history of the
+    same length the same indices.
+    """
+    return np.linspace(0, length - 1, target).astype(np.intp)
+
+@lru_cache(maxsize=32)
+def _similarity_sample_indices(length):
+    """Indices of the (up to) 10 points compared by the plot similarity test, shared per length"""
+    indices = np.linspace(0, length - 1, min(10, length), dtype=int)
+    indices.flags.writeable = False
+    return indices
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path, mtime):
+    """Parse a simulation's config.json; mtime is part of the cache key so edits are picked up.
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=32)
+def _ion_display(ion):
+    """Display form of an ion/species name: short symbols upper-cased (CL, NA), longer names capitalized"""
+    return ion.upper() if len(ion) <= 2 else ion.capitalize()
+
+# Bound value formatters for the PDF parameter table
+_FMT_PLAIN = "{}".format
+_FMT_VOLTS = "{:.3f} V".format
+_FMT_SECONDS = "{:.3f} s".format
+_FMT_PH = "{:.2f}".format
+
+# Channel dependence parameters for the PDF parameter table: (test on the channel's dependence
+# type, rows of (config key, label after the channel name, value formatter)). Rows whose key is
+# missing from the config are left out.
+_DEPENDENCE_SPECS = (
+    (lambda dependence_type: 'voltage' in dependence_type, (
+        ('voltage_exponent', "V Exponent", _FMT_PLAIN),
+        ('half_act_voltage', "Half-Act V", _FMT_VOLTS),
+        ('voltage_multiplier', "V Multiplier", _FMT_PLAIN),
+    )),
+    (lambda dependence_type: 'pH' in dependence_type, (
+        ('pH_exponent', "pH Exponent", _FMT_PLAIN),
+        ('half_act_pH', "Half-Act pH", _FMT_PH),
+    )),
+    (lambda dependence_type: dependence_type == 'time', (
+        ('time_exponent', "Time Exponent", _FMT_PLAIN),
+        ('half_act_time', "Half-Act Time", _FMT_SECONDS),
+    )),
+)
+
+# Graph page layouts for save_all_to_pdf by number of graphs on the page:
+# (figure size, GridSpec arguments or None for a single full-page axes, grid cells in graph order).
+# Grids use wider-than-tall cells so the graphs keep a landscape aspect ratio.
+_PDF_GRID_2X2 = dict(nrows=2, ncols=2, height_ratios=[1, 1], width_ratios=[1.5, 1.5], hspace=0.35, wspace=0.25)
+_PDF_GRID_3X2 = dict(nrows=3, ncols=2, height_ratios=[1, 1, 1], width_ratios=[1.5, 1.5], hspace=0.35, wspace=0.25)
+_PDF_PAGE_LAYOUTS = {
+    1: ((10, 7), None, None),
+    2: ((10, 11), dict(nrows=2, ncols=1, height_ratios=[1, 1], hspace=0.3), ((0, 0), (1, 0))),
+    3: ((12, 9), _PDF_GRID_2X2, ((0, 0), (0, 1), (1, 0))),  # Bottom right left empty
+    4: ((12, 9), _PDF_GRID_2X2, ((0, 0), (0, 1), (1, 0), (1, 1))),
+    5: ((12, 11), _PDF_GRID_3X2, ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0))),  # Bottom right left empty
+    6: ((12, 11), _PDF_GRID_3X2, ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1))),
+}
+
+# Rows of the pairwise similarity matrix computed per NumPy broadcast
+_SIMILARITY_BLOCK_ROWS = 256
+
+# Similarity groupings remembered per (y variable, plotted simulations), least recently used dropped first
+_SIMILARITY_CACHE_SIZE = 64
+
+# Rows of a CSV export formatted as text at a time, which bounds the memory of the string table
+_CSV_CHUNK_ROWS = 10000
+
+def _as_plot_array(data):
+    """Return data as a C-contiguous float32 array (matplotlib's fast path for line data)"""
+    if isinstance(data, np.ndarray) and data.dtype == np.float32 and data.flags.c_contiguous:
+        return data
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+def _resample_to_time_points(x_data, y_data, time_points, tolerance):
+    """Sample y_data at time_points for CSV export.
+    
+    Points within tolerance of a sample take its value; the others are linearly interpolated
+    between the bracketing samples, falling back to the nearest sample at either end.
+    
+    Returns:
+        (column, inside): the values, and a mask of the time points within the range of x_data.
+        Sampled values keep the dtype of y_data, so they are written as the samples would be;
+        the column is an object array where that dtype can't also hold the interpolated values
+        or the NaN padding. Points outside the range have no value; NaN inside it is a NaN sample.
+    """
+    if len(x_data) == 0:
+        return np.full(len(time_points), np.nan), np.zeros(len(time_points), dtype=bool)
+    x_data = np.asarray(x_data, dtype=np.float64)
+    y_data = np.asarray(y_data)
+    last = len(x_data) - 1
+    inside = (time_points >= x_data[0]) & (time_points <= x_data[-1])
+    points = time_points[inside]
+    
+    # Closest sample, preferring the earlier one on ties
+    if np.all(np.diff(x_data) >= 0):
+        right = np.clip(np.searchsorted(x_data, points), 0, last)
+        left = np.maximum(right - 1, 0)
+        idx = np.where(np.abs(x_data[left] - points) <= np.abs(x_data[right] - points), left, right)
+    else:
+        # searchsorted needs sorted x; an unsorted x variable (e.g. voltage) is scanned in
+        # full for every point, in blocks that keep the distance matrix around a million cells
+        idx = np.empty(len(points), dtype=np.intp)
+        block = max(1, (1 << 20) // len(x_data))
+        for start in range(0, len(points), block):
+            stop = start + block
+            idx[start:stop] = np.abs(x_data[None, :] - points[start:stop, None]).argmin(axis=1)
+    values = y_data[idx]
+    
+    interpolate = (np.abs(x_data[idx] - points) >= tolerance) & (idx > 0) & (idx < last)
+    if interpolate.any():
+        idx_low = np.where(x_data[idx] > points, idx - 1, idx)[interpolate]
+        idx_high = idx_low + 1
+        t = (points[interpolate] - x_data[idx_low]) / (x_data[idx_high] - x_data[idx_low])
+        interpolated = y_data[idx_low] + t * (y_data[idx_high] - y_data[idx_low])
+        if interpolated.dtype != values.dtype:
+            # e.g. integer or float32 samples between float64 interpolations; listing the
+            # values keeps them numpy scalars, which are formatted like the source dtype
+            values = np.array(list(values), dtype=object)
+        values[interpolate] = interpolated
+    
+    if inside.all():
+        return values, inside
+    column = np.full(len(time_points), np.nan, dtype=values.dtype if values.dtype.kind in 'fcO' else object)
+    column[inside] = values
+    return column, inside
+
+def _write_csv_table(csvfile, time_points, columns, chunk_rows=_CSV_CHUNK_ROWS):
+    """Write CSV rows of a time column followed by the resampled columns, chunk_rows at a time
+    
+    Args:
+        csvfile: Text file opened with newline=''
+        time_points: The time of each row
+        columns: (column, inside) pairs from _resample_to_time_points; cells outside a
+            column's range are left empty, NaN samples are written as 'nan' like csv.writer does
+        chunk_rows: Number of rows converted to text per np.savetxt call
+    """
+    for start in range(0, len(time_points), chunk_rows):
+        rows = slice(start, start + chunk_rows)
+        times = time_points[rows]
+        table = np.empty((len(times), len(columns) + 1), dtype=object)
+        table[:, 0] = times.astype(str)
+        for col, (column, inside) in enumerate(columns, start=1):
+            table[:, col] = np.where(inside[rows], column[rows].astype(str), '')
+        np.savetxt(csvfile, table, fmt='%s', delimiter=',', newline='\r\n')
 class ResultsTabSuite(QWidget):
     """
     Tab for displaying simulation results from multiple simulations in a suite.
@@ -36,8 +295,27 @@ class ResultsTabSuite(QWidget):
         super().__init__()
         self.suite = suite
         self.simulation_data = {}  # Dictionary to hold loaded simulation data
+        self._array_cache = _ArrayCache()  # Loaded history arrays keyed by (sim_hash, var_name)
+        
+        # Background history loading: request id -> [graph (None once replaced), number of files still loading, (sim_hash, var_name) keys]
+        self._pending_loads = {}
+        self._load_request_id = 0
+        self._history_signals = _HistoryLoaderSignals()
+        self._history_signals.data_ready.connect(self._on_history_loaded)
         self.selected_simulations = []  # List of selected simulation hashes
+        self._selected_set = set()  # Same hashes as selected_simulations, for membership checks
+        self._dropdown_vars_cache = {}  # frozenset of simulation hashes -> sorted variable names
+        self._time_cache = {}  # (total_time, count) -> synthesized time array shared by simulations
+        self._plot_pair_cache = _ArrayCache(max_bytes=128 << 20)  # (sim_hash, x_var, y_var) -> _PlotPair
         self.exporting_graphs = set()  # Set to track graphs that are currently being exported
+        self._similarity_cache = OrderedDict()  # (y_var, plotted sim hashes) -> groups of similar plot indices
+        self._batch_drawing = False  # True while update_all_graphs defers canvas redraws
+        
+        # Coalesces the dropdown and status refreshes of a burst of simulation toggles into one
+        self._selection_refresh_timer = QTimer(self)
+        self._selection_refresh_timer.setSingleShot(True)
+        self._selection_refresh_timer.setInterval(50)
+        self._selection_refresh_timer.timeout.connect(self._refresh_selection_views)
         
         # Create the main layout
         self.main_layout = QVBoxLayout()
@@ -64,18 +342,12 @@ class ResultsTabSuite(QWidget):
         # Title for simulation selection
         selection_layout.addWidget(QLabel("Select Simulations to Plot"))
         
-        # Create a container widget for checkboxes
-        self.checkboxes_container = QWidget()
-        self.checkboxes_layout = QVBoxLayout(self.checkboxes_container)
-        self.checkboxes_layout.setContentsMargins(0, 0, 0, 0)
-        self.checkboxes_layout.setSpacing(2)
-        
-        # Add checkbox container to a scrollable area if we have many simulations
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.checkboxes_container)
+        # One list widget with checkable items, rather than a checkbox widget per simulation;
+        # it scrolls by itself and reports every toggle through a single signal
+        self.simulation_list = QListWidget()
+        self.simulation_list.itemChanged.connect(self._on_simulation_item_changed)
         
-        selection_layout.addWidget(scroll_area)
+        selection_layout.addWidget(self.simulation_list)
         
         # Button to select/deselect all
         buttons_layout = QHBoxLayout()
@@ -129,8 +401,9 @@ class ResultsTabSuite(QWidget):
         
         selection_layout.addLayout(export_options_layout)
         
-        # Store mapping between checkboxes and simulation hashes
-        self.checkbox_sim_map = {}
+        # Store mapping between simulation hashes and their list items
+        self.simulation_items = {}
+        self._sim_positions = {}  # Simulation hash -> position of its item in the list
         
         # Add to splitter
         self.splitter.addWidget(selection_widget)
@@ -148,7 +421,8 @@ class ResultsTabSuite(QWidget):
         self.original_remove_graph = self.graph_widget.remove_graph
         
         # Connect to existing graphs
-        debug_print(f"DEBUG: Connecting signals for {len(self.graph_widget.graphs)} existing graphs")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: Connecting signals for {len(self.graph_widget.graphs)} existing graphs")
         for graph in self.graph_widget.graphs:
             self._connect_graph_signals(graph)
         
@@ -157,10 +431,29 @@ class ResultsTabSuite(QWidget):
         
         # Define update_all_graphs method to properly handle all graphs
         def update_all_graphs():
-            debug_print(f"DEBUG: update_all_graphs called for {len(self.graph_widget.graphs)} graphs")
+            if app_settings.DEBUG_LOGGING:
+                debug_print(f"DEBUG: update_all_graphs called for {len(self.graph_widget.graphs)} graphs")
+            self._batch_drawing = True
+            try:
+                # The selection is the same for every graph, so validate it once
+                prepared = self._prepare_plot_context()
+                for graph in self.graph_widget.graphs:
+                    if app_settings.DEBUG_LOGGING:
+                        debug_print(f"DEBUG: Updating graph {graph.graph_id}")
+                    self.update_specific_graph(graph, prepared=prepared)
+            finally:
+                self._batch_drawing = False
+            
+            # Redraw every updated graph once, after the whole batch has been plotted.
+            # Graphs scrolled out of view (and hooked up to eventFilter) are rendered when
+            # they are next painted instead
             for graph in self.graph_widget.graphs:
-                debug_print(f"DEBUG: Updating graph {graph.graph_id}")
-                self.update_specific_graph(graph)
+                if getattr(graph, '_needs_draw', False):
+                    graph._needs_draw = False
+                    if graph._signals_connected and graph.canvas.visibleRegion().isEmpty():
+                        graph.canvas._render_on_paint = True
+                    else:
+                        graph.canvas.draw_idle()
         
         # Replace the update_all_graphs method
         self.graph_widget.update_all_graphs = update_all_graphs
@@ -176,69 +469,69 @@ class ResultsTabSuite(QWidget):
         # First, use the original method to add the graph
         debug_print("DEBUG: Creating new graph")
         graph = self.original_add_graph()
-        debug_print(f"DEBUG: New graph created with ID {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: New graph created with ID {graph.graph_id}")
         
         # Connect signals for this graph
-        graph.remove_requested.connect(lambda g: self.original_remove_graph(g))
-        graph.plot_requested.connect(self._on_plot_requested)
-        graph.export_requested.connect(self._on_export_requested)
-        graph.download_png_requested.connect(lambda g: self._on_download_png_requested(g))
-        debug_print(f"DEBUG: Connected signals for new graph {graph.graph_id}")
+        self._connect_graph_signals(graph)
         
         # Return the new graph
         return graph
     
     def _connect_graph_signals(self, graph):
         """Helper method to connect signals for a graph"""
-        debug_print(f"DEBUG: Connecting signals for graph {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: Connecting signals for graph {graph.graph_id}")
         
-        # First disconnect any existing connections to avoid duplicates
-        try:
-            graph.plot_requested.disconnect()
-            debug_print(f"DEBUG: Disconnected plot_requested for graph {graph.graph_id}")
-        except:
-            pass
-            
-        try:
-            graph.export_requested.disconnect()
-            debug_print(f"DEBUG: Disconnected export_requested for graph {graph.graph_id}")
-        except:
-            pass
-            
-        try:
-            graph.remove_requested.disconnect()
-            debug_print(f"DEBUG: Disconnected remove_requested for graph {graph.graph_id}")
-        except:
-            pass
-            
-        try:
-            graph.download_png_requested.disconnect()
-            debug_print(f"DEBUG: Disconnected download_png_requested for graph {graph.graph_id}")
-        except:
-            pass
+        # Disconnect our earlier connections to avoid duplicates - a graph that was never
+        # connected has nothing to disconnect, but needs its deferred-render hook
+        if not graph._signals_connected:
+            graph.canvas.installEventFilter(self)
+        else:
+            for signal in (graph.plot_requested, graph.export_requested,
+                           graph.remove_requested, graph.download_png_requested):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass
+            if app_settings.DEBUG_LOGGING:
+                debug_print(f"DEBUG: Disconnected existing signals for graph {graph.graph_id}")
         
-        # Connect the signals properly
+        # Connect the signals properly - each signal sends the graph itself, so the
+        # slots can be connected directly without a per-graph closure
         graph.plot_requested.connect(self._on_plot_requested)
         graph.export_requested.connect(self._on_export_requested)
-        graph.download_png_requested.connect(lambda g=graph: self._on_download_png_requested(g))
+        graph.download_png_requested.connect(self._on_download_png_requested)
         
         # THIS IS KEY: Direct connection to the original remove_graph method
-        graph.remove_requested.connect(lambda g=graph: self.original_remove_graph(g))
+        graph.remove_requested.connect(self.original_remove_graph)
+        graph._signals_connected = True
         
-        debug_print(f"DEBUG: Connected all signals for graph {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: Connected all signals for graph {graph.graph_id}")
+    
+    def eventFilter(self, obj, event):
+        """Render a graph canvas whose batch redraw was deferred while it was out of view"""
+        if event.type() == QEvent.Paint and getattr(obj, '_render_on_paint', False):
+            obj._render_on_paint = False
+            obj.draw()
+        return super().eventFilter(obj, event)
     
     def _on_plot_requested(self, graph):
         """Slot to handle plot_requested signal"""
-        debug_print(f"DEBUG: _on_plot_requested received for graph {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: _on_plot_requested received for graph {graph.graph_id}")
         self.update_specific_graph(graph)
     
     def _on_export_requested(self, graph):
         """Slot to handle export_requested signal"""
-        debug_print(f"DEBUG: _on_export_requested received for graph {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: _on_export_requested received for graph {graph.graph_id}")
         
         # Skip if this graph was already handled by direct method call
         if hasattr(graph, '_direct_export_handled') and graph._direct_export_handled:
-            debug_print(f"DEBUG: Export already handled directly for graph {graph.graph_id}")
+            if app_settings.DEBUG_LOGGING:
+                debug_print(f"DEBUG: Export already handled directly for graph {graph.graph_id}")
             # Clear the flag after checking it
             graph._direct_export_handled = False
             return
@@ -247,7 +540,8 @@ class ResultsTabSuite(QWidget):
         
     def _on_download_png_requested(self, graph):
         """Slot to handle download_png_requested signal"""
-        debug_print(f"DEBUG: _on_download_png_requested received for graph {graph.graph_id}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"DEBUG: _on_download_png_requested received for graph {graph.graph_id}")
         # The actual download functionality is handled in the GraphWidget class
         # This method exists for consistency with the signal/slot pattern
     
@@ -261,7 +555,21 @@ class ResultsTabSuite(QWidget):
         
         # Clear existing data
         self.simulation_data = {}
-        self.checkbox_sim_map = {}
+        self._array_cache.clear()
+        self._pending_loads.clear()  # Drop results of loads started for the previous simulations
+        self._dropdown_vars_cache.clear()
+        self._time_cache.clear()
+        self._plot_pair_cache.clear()
+        self._similarity_cache.clear()
+        self.simulation_items = {}
+        self._sim_positions = {}
+        self.selected_simulations = []
+        self._selected_set = set()
+        self._selection_refresh_timer.stop()
+        
+        # Clear all existing items along with their mapping, so no stale item is left to toggle
+        # even if no simulations are found
+        self.simulation_list.clear()
         
         # Show a progress dialog for loading
         progress = QProgressDialog("Loading simulation metadata...", "Cancel", 0, 100, self)
@@ -271,6 +579,8 @@ class ResultsTabSuite(QWidget):
         progress.show()
         QApplication.processEvents()  # Ensure dialog is shown
         
+        executor = None  # Reads metadata.json files once the simulations are listed
+        entries = []  # Future of each simulation's entry, in suite order
         try:
             # First, get list of simulations from the suite
             progress.setLabelText("Listing simulations...")
@@ -282,45 +592,65 @@ class ResultsTabSuite(QWidget):
             if not simulations:
                 progress.close()
                 return
-                
-            # Clear all existing checkboxes
-            while self.checkboxes_layout.count():
-                item = self.checkboxes_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+            
+            # Signals stay blocked while the list is rebuilt, so filling it doesn't report
+            # every item as a toggle
+            self.simulation_list.blockSignals(True)
             
             progress.setLabelText("Building UI components...")
             progress.setValue(10)
             QApplication.processEvents()
             
             # Iterate through simulations and load their data
-            first_checkbox = None
+            first_item = None
+            first_sim_hash = None
             
             # Filter to only include simulations that have been run
             run_simulations = [sim for sim in simulations if sim.get('has_run', False)]
             
             # If no simulations have been run, show a message
             if not run_simulations:
-                # Add a label to show there are no run simulations
-                no_sims_label = QLabel("No run simulations available. Please run some simulations first.")
-                no_sims_label.setAlignment(Qt.AlignCenter)
-                self.checkboxes_layout.addWidget(no_sims_label)
+                # Add a non-selectable item to show there are no run simulations
+                no_sims_item = QListWidgetItem("No run simulations available. Please run some simulations first.")
+                no_sims_item.setFlags(Qt.NoItemFlags)
+                no_sims_item.setTextAlignment(Qt.AlignCenter)
+                self.simulation_list.addItem(no_sims_item)
                 progress.close()
                 return
             
             # Calculate the progress increment per simulation
             progress_per_sim = 80 / len(run_simulations)
             
+            # Suspend repaints of the simulation list while it is filled, so it is laid out
+            # once at the end instead of after every added item
+            self.simulation_list.setUpdatesEnabled(False)
+            
+            # Reading metadata.json is file I/O only, so it runs on a thread pool while the
+            # list items are created here in suite order as each result becomes available
+            executor = ThreadPoolExecutor(max_workers=min(8, len(run_simulations)))
+            entries = [executor.submit(self._read_simulation_entry, sim_info['hash'],
+                                       sim_info['display_name'], sim_info['index'])
+                       for sim_info in run_simulations]
+            
             # Process simulations
+            last_percent = 10
+            last_events = time.monotonic()
             for idx, sim_info in enumerate(run_simulations):
-                # Check for cancellation
+                # Check for cancellation; reads still queued are cancelled on shutdown below
                 if progress.wasCanceled():
                     break
                     
-                # Update progress
-                progress.setValue(10 + int(idx * progress_per_sim))
-                progress.setLabelText(f"Loading simulation {idx+1}/{len(run_simulations)}...")
-                QApplication.processEvents()  # Keep UI responsive
+                # Update progress only when the percentage changes (a modal dialog pumps
+                # events on every setValue), and keep the UI responsive at most every 50 ms
+                percent = 10 + int(idx * progress_per_sim)
+                if percent != last_percent:
+                    last_percent = percent
+                    progress.setValue(percent)
+                now = time.monotonic()
+                if now - last_events >= 0.05:
+                    last_events = now
+                    progress.setLabelText(f"Loading simulation {idx+1}/{len(run_simulations)}...")
+                    QApplication.processEvents()
                 
                 display_name = sim_info['display_name']
                 sim_hash = sim_info['hash']
@@ -331,32 +661,31 @@ class ResultsTabSuite(QWidget):
                 if not has_run:
                     continue
                 
-                # Load simulation data (just metadata at this point with lazy loading)
-                self.load_simulation_data(sim_hash, display_name, sim_index)
-                
-                # Create checkbox for this simulation
-                checkbox = QCheckBox(f"{display_name} (#{sim_index}) [✓]")
-                checkbox.setChecked(False)  # Uncheck by default
+                # Store simulation data (just metadata at this point with lazy loading)
+                entry = entries[idx].result()
+                if entry is not None:
+                    self.simulation_data[sim_hash] = entry
                 
-                # Connect the state changed signal
-                checkbox.stateChanged.connect(self.update_selected_simulations)
+                # Create a checkable item for this simulation, unchecked by default; its hash
+                # tells _on_simulation_item_changed which simulation was toggled
+                item = QListWidgetItem(f"{display_name} (#{sim_index}) [✓]")
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                item.setData(Qt.UserRole, sim_hash)
                 
-                # Store the simulation hash as user data
-                checkbox.setProperty("sim_hash", sim_hash)
-                
-                # Add to the layout
-                self.checkboxes_layout.addWidget(checkbox)
+                # Add to the list
+                self.simulation_list.addItem(item)
                 
                 # Store in our mapping
-                self.checkbox_sim_map[sim_hash] = checkbox
-                
-                # Keep track of first checkbox
-                if first_checkbox is None:
-                    first_checkbox = checkbox
+                self._sim_positions[sim_hash] = len(self.simulation_items)
+                self.simulation_items[sim_hash] = item
                 
-                # Process events every few simulations to keep UI responsive
-                if idx % 3 == 0:
-                    QApplication.processEvents()
+                # Keep track of first item
+                if first_item is None:
+                    first_item = item
+                    first_sim_hash = sim_hash
+            
+            self.simulation_list.setUpdatesEnabled(True)
             
             # Update progress before finalizing
             progress.setLabelText("Finalizing...")
@@ -367,23 +696,31 @@ class ResultsTabSuite(QWidget):
             self.populate_variable_dropdowns()
             
             # Select first run simulation by default if available
-            if first_checkbox is not None:
-                # Block signals to prevent triggering update_selected_simulations
-                first_checkbox.blockSignals(True)
-                first_checkbox.setChecked(True)
-                first_checkbox.blockSignals(False)
+            if first_item is not None:
+                # The list's signals are still blocked, so this doesn't trigger a selection update
+                first_item.setCheckState(Qt.Checked)
                 
                 # Manually add to selected_simulations without plotting
-                sim_hash = first_checkbox.property("sim_hash")
-                if sim_hash:
-                    self.selected_simulations = [sim_hash]
-                    # Update variable dropdowns now that we have a selected simulation
-                    self.populate_variable_dropdowns()
+                self.selected_simulations = [first_sim_hash]
+                self._selected_set = {first_sim_hash}
+                # Update variable dropdowns now that we have a selected simulation
+                self.populate_variable_dropdowns()
             
             # Display a message to click Plot - without rendering the actual data yet
             self._update_selection_status()
             
         finally:
+            # Stop metadata reads nobody will collect if loading was cancelled or failed
+            # (cancelled one by one, as shutdown's cancel_futures needs Python 3.9)
+            if executor is not None:
+                for entry in entries:
+                    entry.cancel()
+                executor.shutdown(wait=False)
+            
+            # Make sure the simulation list repaints and reports toggles even if loading was interrupted
+            self.simulation_list.setUpdatesEnabled(True)
+            self.simulation_list.blockSignals(False)
+            
             # Ensure progress dialog is closed
             progress.setValue(100)
             progress.close()
@@ -393,6 +730,19 @@ class ResultsTabSuite(QWidget):
         if not self.suite:
             return
         
+        entry = self._read_simulation_entry(sim_hash, display_name, sim_index)
+        if entry is not None:
+            self.simulation_data[sim_hash] = entry
+    
+    def _read_simulation_entry(self, sim_hash, display_name, sim_index=None):
+        """Read a simulation's metadata and build its simulation_data entry
+        
+        Only reads files and touches no widgets or shared state, so load_suite_simulations
+        can call it from worker threads.
+        
+        Returns:
+            The entry dict, or None if the simulation's data can't be found or read
+        """
         # Get the directory for this simulation
         sim_dir = os.path.join(self.suite.suite_path, sim_hash)
         histories_dir = os.path.join(sim_dir, 'histories')
@@ -400,13 +750,13 @@ class ResultsTabSuite(QWidget):
         # Check if the directories exist
         if not os.path.exists(sim_dir) or not os.path.exists(histories_dir):
             debug_print(f"Warning: Cannot find data for simulation {display_name}")
-            return
+            return None
         
         # Load metadata to get available variables
         metadata_file = os.path.join(histories_dir, 'metadata.json')
         if not os.path.exists(metadata_file):
             debug_print(f"Warning: No metadata found for simulation {display_name}")
-            return
+            return None
         
         try:
             with open(metadata_file, 'r') as f:
@@ -423,43 +773,32 @@ class ResultsTabSuite(QWidget):
             has_run = metadata.get('has_run', False)
             
             # Create entry for this simulation - but don't load the data yet
-            self.simulation_data[sim_hash] = {
+            entry = {
                 'display_name': display_name,
                 'metadata': metadata,
-                'data': {},
                 'available_histories': available_histories,
+                'normalized_vars': self._normalize_history_names(available_histories),
                 'histories_dir': histories_dir,
                 'index': sim_index,  # Store the explicit index value from list_simulations
-                'has_run': has_run   # Store has_run flag for easier access
+                'plot_label': f"{display_name} (#{sim_index})",  # Legend label, built once
+                'has_run': has_run,  # Store has_run flag for easier access
+                # Note: We don't pre-create simulation_time here anymore - it is loaded from
+                # the .npy file on demand, or synthesized from these parameters if missing
+                'time_params': (metadata.get('total_time', 0.0), metadata.get('count', 0))
             }
             
-            # Note: We don't pre-create simulation_time here anymore
-            # It will be loaded from the .npy file on demand, just like other variables
-            total_time = metadata.get('total_time', 0.0)
-            time_step = metadata.get('time_step', 0.001)
-            count = metadata.get('count', 0)
-            
             # Print loading message for all simulations
-            run_status = "has been run" if has_run else "has NOT been run"
-            debug_print(f"Loaded metadata for {display_name} (#{sim_index}), {len(available_histories)} variables available, {run_status}")
+            if app_settings.DEBUG_LOGGING:
+                run_status = "has been run" if has_run else "has NOT been run"
+                debug_print(f"Loaded metadata for {display_name} (#{sim_index}), {len(available_histories)} variables available, {run_status}")
+            return entry
             
         except Exception as e:
             debug_print(f"Error loading data for simulation {display_name}: {str(e)}")
-    
-    def get_simulation_variable(self, sim_hash, var_name, current_graph=None):
-        """Lazy-load a specific variable for a simulation when needed
-        
-        Args:
-            sim_hash: Hash of the simulation
-            var_name: Name of the variable to load (may be normalized)
-            current_graph: The graph that's currently being updated (optional)
-        """
-        if sim_hash not in self.simulation_data:
             return None
-            
-        sim_data = self.simulation_data[sim_hash]
-        
-        # Handle normalized variable names by finding the actual variable name in this simulation
+    
+    def _resolve_history_name(self, sim_data, var_name):
+        """Map a (possibly normalized) variable name to the history name used by a simulation"""
         actual_var_name = var_name
         available_histories = sim_data.get('available_histories', [])
         
@@ -484,139 +823,292 @@ class ResultsTabSuite(QWidget):
                     actual_var_name = hist_var
                     break
         
+        return actual_var_name
+    
+    @staticmethod
+    def _read_history_file(history_file):
+        """Read a history .npy file, sampled down to about 5000 points for plotting"""
+        try:
+            # Memory-map the file so only the pages holding sampled points are read
+            data = np.load(history_file, mmap_mode='r')
+        except ValueError as e:
+            if "Python objects in dtype" in str(e):
+                # Handle object arrays (e.g., arrays with None values)
+                data = np.load(history_file, allow_pickle=True)
+                # Convert None values to NaN for plotting
+                data = np.array([np.nan if x is None else x for x in data], dtype=float)
+            else:
+                raise e
+        
+        # Sample the data if it's too large (more than 5000 points)
+        # This reduces memory usage and speeds up plotting
+        if len(data) > 5000:
+            data = data[_plot_sample_indices(len(data))]
+        
+        # Copy out of the memory map so the file isn't held open (and locked on Windows)
+        return np.array(data)
+    
+    def _start_history_loads(self, graph, sim_hashes, var_names):
+        """Queue background reads of the uncached history files a graph needs
+        
+        Files are read by _HistoryLoadJob on the global thread pool, so the GUI stays
+        responsive; the graph is updated again once all of them have arrived.
+        
+        Args:
+            graph: The graph waiting for the data
+            sim_hashes: Hashes of the simulations to load
+            var_names: The (x, y) variable names (may be normalized) needed for each simulation
+            
+        Returns:
+            True if the graph is waiting for background loads, False if everything is cached
+        """
+        pending = {}
+        for sim_hash in sim_hashes:
+            sim_data = self.simulation_data.get(sim_hash)
+            if sim_data is None:
+                continue
+            # Simulations whose plot-ready pair is cached don't need their histories again
+            if (sim_hash, *var_names) in self._plot_pair_cache:
+                continue
+            available_histories = sim_data.get('available_histories', [])
+            for var_name in var_names:
+                actual_var_name = self._resolve_history_name(sim_data, var_name)
+                if (sim_hash, actual_var_name) in self._array_cache or actual_var_name not in available_histories:
+                    continue
+                history_file = os.path.join(sim_data['histories_dir'], f"{actual_var_name}.npy")
+                pending[(sim_hash, actual_var_name)] = history_file
+        
+        # A request still running for this graph re-plots it with its current selection when it
+        # completes, which is enough if it covers every file needed now. Otherwise it is replaced,
+        # so the re-plot doesn't read the files of a changed selection on the GUI thread
+        for entry in self._pending_loads.values():
+            if entry[0] is graph:
+                if pending and pending.keys() <= entry[2]:
+                    return True
+                entry[0] = None  # Its files are still cached when they arrive, without a re-plot
+        
+        if not pending:
+            return False
+        
+        self._load_request_id += 1
+        request_id = self._load_request_id
+        self._pending_loads[request_id] = [graph, len(pending), set(pending)]
+        
+        pool = QThreadPool.globalInstance()
+        for (sim_hash, actual_var_name), history_file in pending.items():
+            pool.start(_HistoryLoadJob(self._history_signals, request_id, sim_hash, actual_var_name, history_file))
+        return True
+    
+    def _on_history_loaded(self, request_id, sim_hash, var_name, data):
+        """Cache a history read in the background and re-plot its graph once the request is complete"""
+        entry = self._pending_loads.get(request_id)
+        if entry is None:
+            # Started before the simulations were reloaded
+            return
+        
+        if data is not None and sim_hash in self.simulation_data:
+            self._array_cache.put((sim_hash, var_name), data)
+        
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._pending_loads[request_id]
+        
+        graph = entry[0]
+        if graph is None or graph not in self.graph_widget.graphs:
+            # Replaced by a newer request, or the graph was removed
+            return
+        
+        # Anything still missing failed to load in the background; read it synchronously
+        # this time so the error is reported instead of queueing the same load again
+        graph._load_synchronously = True
+        try:
+            self.update_specific_graph(graph)
+        finally:
+            graph._load_synchronously = False
+    
+    def get_simulation_variable(self, sim_hash, var_name, current_graph=None):
+        """Lazy-load a specific variable for a simulation when needed
+        
+        Args:
+            sim_hash: Hash of the simulation
+            var_name: Name of the variable to load (may be normalized)
+            current_graph: The graph that's currently being updated (optional)
+        """
+        if sim_hash not in self.simulation_data:
+            return None
+            
+        sim_data = self.simulation_data[sim_hash]
+        
+        # Handle normalized variable names by finding the actual variable name in this simulation
+        actual_var_name = self._resolve_history_name(sim_data, var_name)
+        available_histories = sim_data.get('available_histories', [])
+        
         # Check if we already have this data loaded (using actual variable name)
-        if actual_var_name in sim_data['data']:
-            return sim_data['data'][actual_var_name]
+        data = self._array_cache.get((sim_hash, actual_var_name))
+        if data is not None:
+            return data
         
         # Check if this variable is available (using actual variable name)
         if actual_var_name not in available_histories:
             # Special case: if simulation_time is not in available_histories, create it synthetically
             if actual_var_name == 'simulation_time':
-                metadata = sim_data.get('metadata', {})
-                total_time = metadata.get('total_time', 0.0)
-                count = metadata.get('count', 0)
-                if count > 0:
-                    time_data = np.linspace(0, total_time, count)
-                    sim_data['data']['simulation_time'] = time_data
-                    return time_data
-                else:
+                total_time, count = sim_data.get('time_params', (0.0, 0))
+                if count <= 0:
                     return None
+                
+                # Simulations of a sweep usually share their time discretization, so they
+                # all get the same (read-only) array
+                time_data = self._time_cache.get((total_time, count))
+                if time_data is None:
+                    if count > 5000:
+                        # Build only the sampled points, at the same indices as the loaded histories
+                        # so x and y stay aligned, without allocating the full-resolution time axis
+                        time_data = _plot_sample_indices(count) * (total_time / (count - 1))
+                    else:
+                        time_data = np.linspace(0, total_time, count)
+                    time_data.flags.writeable = False
+                    self._time_cache[(total_time, count)] = time_data
+                self._array_cache.put((sim_hash, 'simulation_time'), time_data)
+                return time_data
             return None
         
-        # Optimization: Only show loading message for large datasets
-        show_loading = not var_name.endswith('_count')
+        histories_dir = sim_data['histories_dir']
+        history_file = os.path.join(histories_dir, f"{actual_var_name}.npy")
+        
+        # Optimization: Only show loading message for large datasets, and only once per update
+        show_loading = (current_graph is not None
+                        and not var_name.endswith('_count')
+                        and not getattr(current_graph, '_loading_shown', False))
+        if show_loading:
+            try:
+                show_loading = os.path.getsize(history_file) > 5_000_000
+            except OSError:
+                show_loading = False
         
-        if show_loading and current_graph is not None:
+        if show_loading:
             # Only update the specific graph that's currently being worked on
             if current_graph.axes.lines:  # Only clear if it has content
                 current_graph.axes.clear()
                 current_graph.axes.text(0.5, 0.5, f"Loading data for {sim_data['display_name']}...",
                                   ha='center', va='center', fontsize=12)
-                current_graph.canvas.draw()
+                current_graph.canvas.draw_idle()
+                current_graph._loading_shown = True
                 # Process events immediately to show loading message
                 QApplication.processEvents()
             
         # Load the variable data (using actual variable name)
         try:
-            histories_dir = sim_data['histories_dir']
-            history_file = os.path.join(histories_dir, f"{actual_var_name}.npy")
-            
             if os.path.exists(history_file):
-                try:
-                    data = np.load(history_file)
-                except ValueError as e:
-                    if "Object arrays cannot be loaded when allow_pickle=False" in str(e):
-                        # Handle object arrays (e.g., arrays with None values)
-                        data = np.load(history_file, allow_pickle=True)
-                        # Convert None values to NaN for plotting
-                        data = np.array([np.nan if x is None else x for x in data], dtype=float)
-                    else:
-                        raise e
-                
-                # Sample the data if it's too large (more than 5000 points)
-                # This reduces memory usage and speeds up plotting
-                if len(data) > 5000:
-                    # Calculate the sampling rate
-                    sample_rate = max(1, len(data) // 5000)
-                    # Sample the data
-                    data = data[::sample_rate]
+                data = self._read_history_file(history_file)
                 
                 # Store in cache for faster access next time (using actual variable name)
-                sim_data['data'][actual_var_name] = data
+                self._array_cache.put((sim_hash, actual_var_name), data)
                 return data
         except Exception as e:
             debug_print(f"Error loading {actual_var_name} for {sim_data['display_name']}: {str(e)}")
             
         return None
     
+    @staticmethod
+    def _normalize_history_names(available_histories):
+        """Return the general variable names offered for a simulation's histories"""
+        # Always add simulation_time since it's created synthetically
+        normalized_vars = {'simulation_time'}
+        
+        # Normalize simulation-specific variable names to general names
+        for var_name in available_histories:
+            if var_name.endswith('_inverse_buffer_capacity'):
+                normalized_vars.add('inverse_buffer_capacity')
+            elif var_name.endswith('_unaccounted_ion_conc'):
+                normalized_vars.add('unaccounted_ion_conc')
+            elif var_name.endswith('_time') and var_name != 'simulation_time' and not var_name.endswith('_act_time'):
+                # Skip display_name_time variables (e.g., KCl_time, HighCl_time)
+                # We only show the standardized 'simulation_time'
+                continue
+            else:
+                # Keep the original variable name for non-simulation-specific variables
+                normalized_vars.add(var_name)
+        
+        return frozenset(normalized_vars)
+    
     def populate_variable_dropdowns(self):
         """Find variables available in selected simulations and update graph widgets"""
-        # Find variables available in any of the selected simulations (union)
-        available_variables = set()
-        
         # If no simulations are selected, use all loaded simulations as fallback
         simulations_to_check = self.selected_simulations if self.selected_simulations else list(self.simulation_data.keys())
         
-        for sim_hash in simulations_to_check:
-            if sim_hash in self.simulation_data:
-                sim_data = self.simulation_data[sim_hash]
-                # Use available_histories from metadata instead of checking loaded data
-                available_vars = set(sim_data.get('available_histories', []))
-                
-                # Always add simulation_time since it's created synthetically
-                normalized_vars = {'simulation_time'}
-                
-                # Normalize simulation-specific variable names to general names
-                for var_name in available_vars:
-                    if var_name.endswith('_inverse_buffer_capacity'):
-                        normalized_vars.add('inverse_buffer_capacity')
-                    elif var_name.endswith('_unaccounted_ion_conc'):
-                        normalized_vars.add('unaccounted_ion_conc')
-                    elif var_name.endswith('_time') and var_name != 'simulation_time' and not var_name.endswith('_act_time'):
-                        # Skip display_name_time variables (e.g., KCl_time, HighCl_time)
-                        # We only show the standardized 'simulation_time'
-                        continue
-                    else:
-                        # Keep the original variable name for non-simulation-specific variables
-                        normalized_vars.add(var_name)
-                
-                # Add normalized variables from this simulation (union)
-                available_variables |= normalized_vars
+        # The variable list only depends on which simulations are checked
+        cache_key = frozenset(simulations_to_check)
+        variables_list = self._dropdown_vars_cache.get(cache_key)
+        if variables_list is None:
+            # Find variables available in any of the selected simulations (union)
+            available_variables = set()
+            for sim_hash in simulations_to_check:
+                if sim_hash in self.simulation_data:
+                    available_variables |= self.simulation_data[sim_hash]['normalized_vars']
+            
+            # Convert to sorted list
+            variables_list = sorted(available_variables)
+            self._dropdown_vars_cache[cache_key] = variables_list
         
         # If we don't have any variables, show a message
-        if not available_variables:
+        if not variables_list:
             debug_print("Warning: No variables found in selected simulations")
             return
         
-        # Convert to sorted list
-        variables_list = sorted(available_variables)
+        # Refilling the comboboxes is only needed for graphs that don't show this list yet;
+        # each graph is checked on its own, as one added after the last was removed starts empty
+        stale_graphs = [graph for graph in self.graph_widget.graphs if graph.variables != variables_list]
+        if not stale_graphs:
+            return
         
-        # Update all graphs with the new variables
-        self.graph_widget.update_variables(variables_list)
+        # Update those graphs with the new variables
+        for graph in stale_graphs:
+            graph.update_variables(variables_list)
         
         # Debug info
-        if len(simulations_to_check) > 0:
+        if app_settings.DEBUG_LOGGING and len(simulations_to_check) > 0:
             debug_print(f"Updated variable dropdowns with {len(variables_list)} variables from {len(simulations_to_check)} selected simulation(s)")
     
     def select_all_simulations(self):
-        """Select all simulations by checking all checkboxes"""
-        for sim_hash, checkbox in self.checkbox_sim_map.items():
-            checkbox.setChecked(True)
+        """Select all simulations by checking all items"""
+        self._set_all_checked(True)
     
     def deselect_all_simulations(self):
-        """Deselect all simulations by unchecking all checkboxes"""
-        for sim_hash, checkbox in self.checkbox_sim_map.items():
-            checkbox.setChecked(False)
+        """Deselect all simulations by unchecking all items"""
+        self._set_all_checked(False)
+    
+    def _set_all_checked(self, checked):
+        """Check or uncheck every simulation item, updating the selection once at the end"""
+        # Repaint the list once after all items have changed, and block its signals so each
+        # item doesn't update the selection on its own
+        state = Qt.Checked if checked else Qt.Unchecked
+        self.simulation_list.setUpdatesEnabled(False)
+        self.simulation_list.blockSignals(True)
+        try:
+            for item in self.simulation_items.values():
+                item.setCheckState(state)
+        finally:
+            self.simulation_list.blockSignals(False)
+            self.simulation_list.setUpdatesEnabled(True)
+        self.update_selected_simulations()
     
     def update_selected_simulations(self):
-        """Update the list of selected simulations based on checkbox states"""
+        """Update the list of selected simulations based on the items' check states"""
         self.selected_simulations = []
         
-        # Iterate through checkboxes to find selected ones
-        for sim_hash, checkbox in self.checkbox_sim_map.items():
-            if checkbox.isChecked():
+        # Iterate through items to find checked ones
+        for sim_hash, item in self.simulation_items.items():
+            if item.checkState() == Qt.Checked:
                 self.selected_simulations.append(sim_hash)
+        self._selected_set = set(self.selected_simulations)
         
+        # Refresh right away; this also covers any toggles still waiting on the timer
+        self._selection_refresh_timer.stop()
+        self._refresh_selection_views()
+    
+    def _refresh_selection_views(self):
+        """Bring the variable dropdowns and the selection status up to date with the selection"""
         # Update the variable dropdowns with the selected simulations
         # But don't update graphs automatically - wait for Plot button
         self.populate_variable_dropdowns()
@@ -624,6 +1116,34 @@ class ResultsTabSuite(QWidget):
         # Just update the UI to show that selections have changed
         self._update_selection_status()
     
+    def _on_simulation_item_changed(self, item):
+        """Forward a change of a simulation item to _on_simulation_toggled"""
+        sim_hash = item.data(Qt.UserRole)
+        if sim_hash is not None:
+            self._on_simulation_toggled(sim_hash, item.checkState())
+    
+    def _on_simulation_toggled(self, sim_hash, state):
+        """Add or remove one simulation from the selection when its item is checked or unchecked"""
+        checked = state == Qt.Checked
+        if sim_hash not in self._sim_positions or checked == (sim_hash in self._selected_set):
+            return
+        
+        if checked:
+            # Keep the selection in list order, which sets the plotting order
+            positions = self._sim_positions
+            insert_at = bisect.bisect([positions[selected] for selected in self.selected_simulations],
+                                      positions[sim_hash])
+            self.selected_simulations = (self.selected_simulations[:insert_at] + [sim_hash] +
+                                         self.selected_simulations[insert_at:])
+            self._selected_set.add(sim_hash)
+        else:
+            self.selected_simulations = [selected for selected in self.selected_simulations
+                                         if selected != sim_hash]
+            self._selected_set.discard(sim_hash)
+        
+        # Restart the timer so rapid toggles lead to a single refresh
+        self._selection_refresh_timer.start()
+    
     def show_unrun_warning(self):
         """
         Method kept for compatibility - no longer needed since we only show run simulations.
@@ -632,32 +1152,13 @@ class ResultsTabSuite(QWidget):
         pass
 
     def free_unused_data(self, keep_sims=None):
-        """Free memory by unloading data for simulations not in the keep_sims list"""
+        """Free memory by unloading data for simulations not in the keep_sims set"""
         if keep_sims is None:
-            keep_sims = self.selected_simulations
-            
-        # Don't do anything if we have no loaded data
-        if not self.simulation_data:
-            return
-            
-        # Count how much memory we might free
-        freed_vars = 0
+            keep_sims = self._selected_set
         
-        # Iterate through all simulations
-        for sim_hash, sim_data in self.simulation_data.items():
-            # Skip selected simulations
-            if sim_hash in keep_sims:
-                continue
-                
-            # Clear data for non-selected simulations
-            if 'data' in sim_data and sim_data['data']:
-                # Don't remove metadata like 'simulation_time' that's cheap to keep
-                vars_to_keep = ['simulation_time']
-                # Count variables we'll remove
-                for var_name in list(sim_data['data'].keys()):
-                    if var_name not in vars_to_keep:
-                        del sim_data['data'][var_name]
-                        freed_vars += 1
+        # Don't remove metadata like 'simulation_time' that's cheap to keep
+        freed_vars = self._array_cache.clear_except(keep_sims, keep_vars=('simulation_time',))
+        self._plot_pair_cache.clear_except(keep_sims)
         
         # Only print if we freed a significant amount of memory
         if freed_vars > 10:
@@ -665,8 +1166,34 @@ class ResultsTabSuite(QWidget):
             
         return freed_vars
 
-    def update_specific_graph(self, graph):
-        """Update a specific graph with selected data"""
+    def _prepare_plot_context(self):
+        """Collect the per-selection state shared by every graph in one update
+        
+        Returns:
+            A dict with the current 'selection' (tuple of selected hashes) and the
+            'valid_simulations' among them that have loaded metadata
+        """
+        # Apply a refresh still pending from recent simulation toggles before plotting
+        if self._selection_refresh_timer.isActive():
+            self._selection_refresh_timer.stop()
+            self._refresh_selection_views()
+        
+        return {
+            'selection': tuple(self.selected_simulations),
+            'valid_simulations': [sim_hash for sim_hash in self.selected_simulations
+                                  if sim_hash in self.simulation_data],
+        }
+    
+    def update_specific_graph(self, graph, prepared=None):
+        """Update a specific graph with selected data
+        
+        Args:
+            graph: The graph to update
+            prepared: Result of _prepare_plot_context, when several graphs are updated together
+        """
+        if prepared is None:
+            prepared = self._prepare_plot_context()
+        
         if app_settings.DEBUG_LOGGING:
             debug_print(f"\n=== DEBUG: update_specific_graph for graph {graph.graph_id} ===")
             debug_print(f"Selected simulations count: {len(self.selected_simulations)}")
@@ -689,21 +1216,34 @@ class ResultsTabSuite(QWidget):
             x_var = selected['x_var']
             y_var = selected['y_var']
             
+            # Same variables, simulations and texts as the last full plot - refresh the existing
+            # lines and blit them over the cached background instead of redrawing everything.
+            # The title and axis labels are part of the cached background, so a change to any
+            # of them needs the full redraw
+            plot_signature = (x_var, y_var, prepared['selection'],
+                              selected['title'], selected['x_label'], selected['y_label'])
+            if getattr(graph, '_plot_signature', None) == plot_signature and self._blit_replot(graph):
+                return
+            graph._plot_signature = None
+            graph._lines_by_sim = {}
+            graph._pairs_by_sim = {}  # _PlotPair each line was drawn from, for exports
+            graph._blit_bg = None
+            graph._loading_shown = False
+            
             # Clear only THIS graph - important so we don't affect other graphs
             graph.axes.clear()
             
             # Check if we have valid simulations and variables
-            if not x_var or not y_var or not self.selected_simulations:
+            if not x_var or not y_var or not prepared['selection']:
                 if app_settings.DEBUG_LOGGING:
                     debug_print("DEBUG: Missing variables or no simulations selected")
                 graph.axes.text(0.5, 0.5, "No data selected for plotting",
                              ha='center', va='center', fontsize=12)
-                graph.canvas.draw()
+                self._draw_graph(graph)
                 return
             
             # Get list of valid simulations to plot - we know all simulations in the list have been run
-            valid_simulations = [sim_hash for sim_hash in self.selected_simulations 
-                                if sim_hash in self.simulation_data]
+            valid_simulations = prepared['valid_simulations']
             
             if app_settings.DEBUG_LOGGING:
                 debug_print(f"DEBUG: Found {len(valid_simulations)} valid simulations")
@@ -714,42 +1254,39 @@ class ResultsTabSuite(QWidget):
                     debug_print("DEBUG: No valid simulations to plot")
                 graph.axes.text(0.5, 0.5, "No valid simulations selected.",
                              ha='center', va='center', fontsize=12)
-                graph.canvas.draw()
+                self._draw_graph(graph)
                 return
             
-            # Show initial loading status - will be updated as data loads
-            if len(valid_simulations) > 2:  # Only show for multiple simulations
-                graph.axes.text(0.5, 0.5, f"Loading data for {len(valid_simulations)} simulations...",
+            # Read uncached histories in the background - the graph is updated again when they arrive
+            if (not getattr(graph, '_load_synchronously', False)
+                    and self._start_history_loads(graph, valid_simulations, (x_var, y_var))):
+                graph.axes.text(0.5, 0.5, f"Loading data for {len(valid_simulations)} simulation{'s' if len(valid_simulations) > 1 else ''}...",
                              ha='center', va='center', fontsize=12)
-                graph.canvas.draw()
-                QApplication.processEvents()  # Keep UI responsive
-            
-            # Colors for different simulations
-            colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', 
-                     '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
-            
-            # Line styles for distinguishing similar plots
-            line_styles = ['-', '--', '-.', ':']
-            
-            # Markers for further distinguishing similar plots
-            markers = ['', 'o', 's', '^', 'x', 'D', '+']
+                self._draw_graph(graph)
+                return
             
             # First pass: load all data
             all_plot_data = []  # Store all plot data to detect similar plots
             
-            # Create a key based on the variables to check the cache
-            cache_key = f"{x_var}_{y_var}"
             if app_settings.DEBUG_LOGGING:
                 debug_print(f"DEBUG: Loading data for variables {x_var}, {y_var}")
             
-            # Only load data if needed (not already cached)
-            for i, sim_hash in enumerate(valid_simulations):
+            # The histories were read in the background above, so this pass only reads the
+            # cache and doesn't need to pump events to stay responsive
+            for sim_hash in valid_simulations:
                 sim_data = self.simulation_data[sim_hash]
                 display_name = sim_data['display_name']
-                sim_index = sim_data.get('index', '?')
+                
+                # Reuse the converted arrays from an earlier plot of the same variables
+                pair_key = (sim_hash, x_var, y_var)
+                cached_pair = self._plot_pair_cache.get(pair_key)
+                if cached_pair is not None:
+                    graph._pairs_by_sim[sim_hash] = cached_pair
+                    all_plot_data.append(PlotEntry(sim_hash, sim_data['plot_label'], *cached_pair[:4]))
+                    continue
                 
                 if app_settings.DEBUG_LOGGING:
-                    debug_print(f"DEBUG: Loading data for simulation {display_name} (#{sim_index})")
+                    debug_print(f"DEBUG: Loading data for simulation {sim_data['plot_label']}")
                 
                 # Lazy load the data we need - pass the current graph to avoid affecting other graphs
                 x_data = self.get_simulation_variable(sim_hash, x_var, current_graph=graph)
@@ -761,56 +1298,47 @@ class ResultsTabSuite(QWidget):
                         debug_print(f"DEBUG: No valid data for {display_name}, skipping")
                     continue
                 
-                # Store data for reuse
-                all_plot_data.append((sim_hash, display_name, sim_index, x_data, y_data))
+                # Convert once to contiguous float32 and remember the value range so the
+                # similarity check below doesn't have to re-scan the data
+                # Trim to the shared length with views so x and y always pair up
+                min_length = min(len(x_data), len(y_data))
+                x_source = x_data[:min_length]
+                y_source = y_data[:min_length]
+                x_data = _as_plot_array(x_source)
+                y_data = _as_plot_array(y_source)
+                y_min = float(np.min(y_data))
+                y_max = float(np.max(y_data))
                 
-                # Process events occasionally to keep UI responsive
-                if i % 3 == 0:
-                    QApplication.processEvents()
-                    
-                    # Check if we need to abort the update
-                    if hasattr(graph, "_abort_update") and graph._abort_update:
-                        if app_settings.DEBUG_LOGGING:
-                            debug_print("DEBUG: Aborting update due to abort flag")
-                        graph._abort_update = False
-                        return
+                # Store data for reuse
+                plot_pair = _PlotPair(x_data, y_data, y_min, y_max, x_source, y_source)
+                self._plot_pair_cache.put(pair_key, plot_pair)
+                graph._pairs_by_sim[sim_hash] = plot_pair
+                all_plot_data.append(PlotEntry(sim_hash, sim_data['plot_label'], x_data, y_data, y_min, y_max))
             
             # Free memory by removing unused simulation data
-            self.free_unused_data(keep_sims=self.selected_simulations)
+            self.free_unused_data(keep_sims=self._selected_set)
             
             # Second pass: find similar plots and adjust visual style
-            # Group similar plots together
-            plot_groups = []
-            used_indices = set()
-            
-            # Second pass: plot the data with appropriate styling
-            for i, (sim_hash, display_name, sim_index, x_data, y_data) in enumerate(all_plot_data):
-                # Skip if we've processed this plot as part of a group
-                if i in used_indices:
-                    continue
-                
-                # Get a color for this plot or group
-                color_idx = len(plot_groups) % len(colors)
-                color = colors[color_idx]
-                
-                # Look for similar plots to group together
-                similar_plots = [(i, sim_hash, display_name, sim_index, x_data, y_data)]
-                
-                # Check remaining plots for similarity
-                for j, (other_hash, other_name, other_index, other_x, other_y) in enumerate(all_plot_data[i+1:], i+1):
-                    # Only group if we have at least 3 points to compare
-                    if len(y_data) >= 3 and len(other_y) >= 3:
-                        # Get the shorter of the two datasets
-                        min_length = min(len(y_data), len(other_y))
-                        
-                        # Ensure x values are comparable (might be different time series)
-                        # For simplicity, just check a few sample points
-                        if self._are_plots_similar(y_data[:min_length], other_y[:min_length]):
-                            similar_plots.append((j, other_hash, other_name, other_index, other_x, other_y))
-                            used_indices.add(j)
-                
-                # Add this group to our plot groups
-                plot_groups.append(similar_plots)
+            # Group similar plots together. The grouping only depends on the plotted variables
+            # (y is trimmed to the length of x) and the set of plotted simulations, so reuse it
+            # when none of them has changed
+            group_key = (x_var, y_var, tuple(plot_data.sim_hash for plot_data in all_plot_data))
+            if len(all_plot_data) <= 1:
+                # Nothing to compare - a lone plot is its own group
+                similar_groups = [[0]] if all_plot_data else []
+            else:
+                similar_groups = self._similarity_cache.get(group_key)
+                if similar_groups is not None:
+                    self._similarity_cache.move_to_end(group_key)
+            
+            if similar_groups is None:
+                similar_groups = self._group_similar_plots(all_plot_data)
+                self._similarity_cache[group_key] = similar_groups
+                if len(self._similarity_cache) > _SIMILARITY_CACHE_SIZE:
+                    self._similarity_cache.popitem(last=False)
+            
+            # Expand the index groups into the plot entries used for styling
+            plot_groups = [[all_plot_data[j] for j in group] for group in similar_groups]
             
             # Ensure we have empty axes to plot on
             if not hasattr(graph, 'axes') or graph.axes is None:
@@ -831,34 +1359,46 @@ class ResultsTabSuite(QWidget):
                 line_handles = []
                 line_labels = []
                 
+                # Work out the style of every line first: (plot data, label, line style, marker, color)
+                styled_plots = []
                 for group_idx, group in enumerate(plot_groups):
                     # Select a color for this group
-                    color = colors[group_idx % len(colors)]
-                    
-                    # Plot each entry in this group with variations
-                    for plot_idx, (_, sim_hash, display_name, sim_index, x_data, y_data) in enumerate(group):
-                        # Determine line style and marker
-                        # For single entry groups, use solid line, no marker
-                        if len(group) == 1:
-                            line_style = '-'
-                            marker = ''
-                        else:
-                            # For multi-entry groups, use varied styles
-                            line_style = line_styles[plot_idx % len(line_styles)]
-                            marker = markers[(plot_idx // len(line_styles)) % len(markers)]
-                        
-                        # Create label with simulation name and index
-                        label = f"{display_name} (#{sim_index})"
-                        
+                    color = _COLORS_RGBA[group_idx % len(_COLORS_RGBA)]
+                    
+                    # Plot each entry in this group with variations; a single entry gets the
+                    # first style (solid line, no marker)
+                    for plot_idx, plot_data in enumerate(group):
+                        line_style, marker = _GROUP_MEMBER_STYLES[plot_idx % len(_GROUP_MEMBER_STYLES)]
+                        styled_plots.append((plot_data, plot_data.label, line_style, marker, color))
+                
+                # Series that all have the same length (the usual case, since long histories are
+                # sampled to a fixed size) are drawn with a single plot call on stacked arrays
+                lengths = {len(plot_data.x_data) for plot_data, *_ in styled_plots}
+                lengths.update(len(plot_data.y_data) for plot_data, *_ in styled_plots)
+                if len(styled_plots) > 1 and len(lengths) == 1:
+                    # Stack as (K, N) and pass the transposes, so each line's column is a contiguous row
+                    x_stack = np.vstack([plot_data.x_data for plot_data, *_ in styled_plots])
+                    y_stack = np.vstack([plot_data.y_data for plot_data, *_ in styled_plots])
+                    lines = graph.axes.plot(x_stack.T, y_stack.T)
+                    markevery = max(1, x_stack.shape[1]//20)  # Same for every line here
+                    for line, (plot_data, label, line_style, marker, color) in zip(lines, styled_plots):
+                        line.set(label=label, linestyle=line_style, marker=marker,
+                                 markersize=4, markevery=markevery, color=color)
+                        line_handles.append(line)
+                        line_labels.append(label)
+                        graph._lines_by_sim[plot_data.sim_hash] = line
+                else:
+                    for plot_data, label, line_style, marker, color in styled_plots:
                         # Plot the data
                         try:
-                            line, = graph.axes.plot(x_data, y_data, label=label, 
+                            line, = graph.axes.plot(plot_data.x_data, plot_data.y_data, label=label, 
                                                  linestyle=line_style, marker=marker, 
-                                                 markersize=4, markevery=max(1, len(x_data)//20),
+                                                 markersize=4, markevery=max(1, len(plot_data.x_data)//20),
                                                  color=color)
                             
                             line_handles.append(line)
                             line_labels.append(label)
+                            graph._lines_by_sim[plot_data.sim_hash] = line
                         except Exception as e:
                             debug_print(f"Error plotting {label}: {str(e)}")
                             continue
@@ -870,20 +1410,31 @@ class ResultsTabSuite(QWidget):
                         graph.axes.legend(line_handles, line_labels, loc='upper left', 
                                        bbox_to_anchor=(1.02, 1), borderaxespad=0)
                     else:
-                        graph.axes.legend(line_handles, line_labels, loc='best')
+                        # A fixed corner: 'best' searches every line vertex for the emptiest spot,
+                        # again on each redraw, pan and zoom
+                        graph.axes.legend(line_handles, line_labels, loc='upper right')
                     
                     # Enable grid for better readability
                     graph.axes.grid(True, linestyle='--', alpha=0.7)
                     
-                    # Make room for legend
-                    graph.figure.tight_layout()
+                    # Make room for legend. The layout only depends on the texts, the legend
+                    # entries, the tick range and the figure size, so skip it when none changed
+                    layout_signature = (selected['title'], selected['x_label'], selected['y_label'],
+                                        tuple(line_labels), graph.axes.get_xlim(), graph.axes.get_ylim(),
+                                        tuple(graph.figure.get_size_inches()))
+                    if getattr(graph, '_layout_signature', None) != layout_signature:
+                        graph.figure.tight_layout()
+                        graph._layout_signature = layout_signature
+                    
+                    # Remember what is plotted so an identical replot can take the blitting path
+                    graph._plot_signature = plot_signature
             else:
                 # No data to plot
                 graph.axes.text(0.5, 0.5, "No data available for selected simulations and variables",
                              ha='center', va='center', fontsize=12)
             
             # Update the canvas
-            graph.canvas.draw()
+            self._draw_graph(graph)
             
         except Exception as e:
             import traceback
@@ -894,18 +1445,160 @@ class ResultsTabSuite(QWidget):
             graph.axes.clear()
             graph.axes.text(0.5, 0.5, f"Error: {str(e)}",
                          ha='center', va='center', fontsize=12)
-            graph.canvas.draw()
+            self._draw_graph(graph)
             
         finally:
             # Reset busy state
             graph._updating = False
 
+    def _blit_replot(self, graph):
+        """Refresh the lines of an unchanged plot in place and blit them.
+        
+        Returns False when the graph has to be redrawn from scratch instead.
+        """
+        lines_by_sim = getattr(graph, '_lines_by_sim', None)
+        if not lines_by_sim or any(line.axes is not graph.axes for line in lines_by_sim.values()):
+            return False
+        
+        # Resizing the canvas invalidates the cached background
+        if not hasattr(graph, '_blit_cid'):
+            graph._blit_cid = graph.canvas.mpl_connect(
+                'resize_event', lambda event, g=graph: setattr(g, '_blit_bg', None))
+        
+        x_var, y_var = graph._plot_signature[:2]
+        for sim_hash, line in lines_by_sim.items():
+            cached_pair = self._plot_pair_cache.get((sim_hash, x_var, y_var))
+            if cached_pair is None:
+                return False
+            line.set_data(cached_pair.x_data, cached_pair.y_data)
+            graph._pairs_by_sim[sim_hash] = cached_pair
+        
+        lines = list(lines_by_sim.values())
+        limits = (graph.axes.get_xlim(), graph.axes.get_ylim())
+        canvas = graph.canvas
+        if getattr(graph, '_blit_bg', None) is None or graph._blit_limits != limits:
+            # Render everything except the lines once and keep that as the background
+            for line in lines:
+                line.set_animated(True)
+            try:
+                canvas.draw()
+                graph._blit_bg = canvas.copy_from_bbox(graph.axes.bbox)
+                graph._blit_limits = limits
+            finally:
+                for line in lines:
+                    line.set_animated(False)
+        else:
+            canvas.restore_region(graph._blit_bg)
+        
+        for line in lines:
+            graph.axes.draw_artist(line)
+        legend = graph.axes.get_legend()
+        if legend is not None:
+            graph.axes.draw_artist(legend)
+        canvas.blit(graph.axes.bbox)
+        return True
+    
+    def _draw_graph(self, graph):
+        """Schedule a redraw of a graph's canvas, or mark it for a single redraw at the end of update_all_graphs"""
+        if self._batch_drawing:
+            graph._needs_draw = True
+        else:
+            graph.canvas.draw_idle()
+    
     def update_graph(self):
         """Update all graphs with data from selected simulations"""
         if app_settings.DEBUG_LOGGING:
             debug_print("DEBUG: update_graph called in ResultsTabSuite - updating all graphs")
         self.graph_widget.update_all_graphs()
 
+    def _group_similar_plots(self, all_plot_data):
+        """Group plots that are similar to each other, directly or through other plots
+        
+        Similar pairs are merged with a union-find over the similarity matrix, so every plot
+        ends up in exactly one group.
+        
+        Returns:
+            List of groups, each a list of indices into all_plot_data, ordered by first member
+        """
+        count = len(all_plot_data)
+        parent = list(range(count))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the lower index as the root so groups stay in plot order
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        # Similarity of all equal-length pairs, computed in one go
+        similar = self._similarity_matrix(all_plot_data)
+        for i, j in zip(*np.nonzero(np.triu(similar, k=1))):
+            union(int(i), int(j))
+        
+        # Pairs of different lengths are compared on their overlapping part
+        for i, plot_data in enumerate(all_plot_data):
+            y_data = plot_data.y_data
+            if len(y_data) < 3:
+                continue
+            for j in range(i + 1, count):
+                other = all_plot_data[j]
+                other_y = other.y_data
+                if len(other_y) < 3 or len(other_y) == len(y_data):
+                    continue
+                
+                # Plots whose value ranges are further apart than 5% of this plot's range
+                # can never pass the similarity test, so skip them without sampling
+                gap = max(other.y_min - plot_data.y_max, plot_data.y_min - other.y_max)
+                if gap >= 0.05 * max(plot_data.y_max - plot_data.y_min, 1e-10):
+                    continue
+                
+                min_length = min(len(y_data), len(other_y))
+                if self._are_plots_similar(y_data[:min_length], other_y[:min_length]):
+                    union(i, j)
+        
+        groups = {}
+        for i in range(count):
+            groups.setdefault(find(i), []).append(i)
+        return list(groups.values())
+    
+    def _similarity_matrix(self, all_plot_data):
+        """Compare every pair of equal-length plots at once
+        
+        Plots of the same length are sampled at the same indices, so each length class is
+        checked with one NumPy broadcast instead of a _are_plots_similar call per pair.
+        
+        Returns:
+            Boolean (N, N) array; entry [i, j] is True when plot j is similar to plot i by the
+            same test as _are_plots_similar (pairs of different lengths are left False)
+        """
+        similar = np.zeros((len(all_plot_data), len(all_plot_data)), dtype=bool)
+        
+        by_length = {}
+        for i, plot_data in enumerate(all_plot_data):
+            by_length.setdefault(len(plot_data.y_data), []).append(i)
+        
+        for length, members in by_length.items():
+            if length < 3 or len(members) < 2:
+                continue
+            sample_indices = _similarity_sample_indices(length)
+            samples = np.array([all_plot_data[i].y_data[sample_indices] for i in members], dtype=np.float64)
+            
+            # Mean absolute difference between every pair, relative to the first plot's range.
+            # Rows are done in blocks so the (rows, N, samples) temporary stays small for big suites
+            ranges = np.ptp(samples, axis=1, keepdims=True).clip(min=1e-10)
+            members = np.asarray(members)
+            for start in range(0, len(members), _SIMILARITY_BLOCK_ROWS):
+                block = slice(start, start + _SIMILARITY_BLOCK_ROWS)
+                diff = np.abs(samples[block, None, :] - samples[None, :, :]).mean(axis=-1)
+                similar[np.ix_(members[block], members)] = diff / ranges[block] < 0.05
+        
+        return similar
+    
     def _are_plots_similar(self, y_data1, y_data2):
         """Helper method to detect if two plots are very similar"""
         # Safety check for empty arrays
@@ -913,17 +1606,27 @@ class ResultsTabSuite(QWidget):
             return False
             
         # Simple similarity detection - compare a few sample points
-        sample_size = min(10, len(y_data1), len(y_data2))
-        sample_indices = np.linspace(0, min(len(y_data1), len(y_data2)) - 1, sample_size, dtype=int)
-        
-        y1_sample = y_data1[sample_indices]
-        y2_sample = y_data2[sample_indices]
-        
-        # Calculate mean absolute difference 
-        diff = np.mean(np.abs(y1_sample - y2_sample))
+        sample_indices = _similarity_sample_indices(min(len(y_data1), len(y_data2)))
+        sample_size = len(sample_indices)
+        
+        # Pull the few samples out as Python floats and reduce them in a single loop -
+        # for ~10 values this is cheaper than several separate NumPy dispatches
+        y1_sample = y_data1[sample_indices].tolist()
+        y2_sample = y_data2[sample_indices].tolist()
+        
+        # Calculate mean absolute difference and the range of the first plot in one pass
+        diff_sum = 0.0
+        y1_min = y1_max = y1_sample[0]
+        for a, b in zip(y1_sample, y2_sample):
+            diff_sum += abs(a - b)
+            if a < y1_min:
+                y1_min = a
+            elif a > y1_max:
+                y1_max = a
+        diff = diff_sum / sample_size
         
         # If difference is small compared to the range, consider them similar
-        y_range = max(np.max(y1_sample) - np.min(y1_sample), 1e-10)  # Avoid division by zero
+        y_range = max(y1_max - y1_min, 1e-10)  # Avoid division by zero
         similarity_ratio = diff / y_range
         
         # Consider plots similar if difference is less than 5% of the data range
@@ -941,7 +1644,8 @@ class ResultsTabSuite(QWidget):
         # Prevent duplicate calls for the same graph
         graph_id = id(graph)
         if graph_id in self.exporting_graphs:
-            debug_print(f"DEBUG: Already exporting graph {graph.graph_id}, skipping duplicate call")
+            if app_settings.DEBUG_LOGGING:
+                debug_print(f"DEBUG: Already exporting graph {graph.graph_id}, skipping duplicate call")
             return
             
         # Add this graph to the exporting set
@@ -959,7 +1663,7 @@ class ResultsTabSuite(QWidget):
                 debug_print("No plotted data to export")
                 graph.axes.text(0.5, 0.5, "No data to export.\nPlease plot the graph first.",
                          ha='center', va='center', fontsize=12)
-                graph.canvas.draw()
+                graph.canvas.draw_idle()
                 return
             
             # Ask user where to save
@@ -1000,9 +1704,21 @@ class ResultsTabSuite(QWidget):
                     sim_durations = []
                     time_steps = []
                     
+                    # Export the full-precision arrays captured when the lines were plotted, rather
+                    # than the float32 copies held by the lines themselves
+                    pairs_by_sim = getattr(graph, '_pairs_by_sim', {})
+                    source_pairs = {id(line): pairs_by_sim.get(sim_hash)
+                                    for sim_hash, line in getattr(graph, '_lines_by_sim', {}).items()}
                     for line in lines:
-                        x_data = line.get_xdata()
-                        y_data = line.get_ydata()
+                        source_pair = source_pairs.get(id(line))
+                        if source_pair is not None:
+                            x_data, y_data = source_pair.x_source, source_pair.y_source
+                        else:
+                            x_data = line.get_xdata()
+                            y_data = line.get_ydata()
+                        min_length = min(len(x_data), len(y_data))
+                        x_data = x_data[:min_length]
+                        y_data = y_data[:min_length]
                         
                         if len(x_data) > 0:
                             # Calculate simulation duration
@@ -1047,42 +1763,11 @@ class ResultsTabSuite(QWidget):
                         # Exclude duplicate times from floating point rounding
                         uniform_time_points = np.unique(np.round(uniform_time_points, 10))
                         
-                        # For each time point in our uniform grid, get data from all lines
-                        for time_point in uniform_time_points:
-                            row = [time_point]
-                            
-                            for x_data, y_data in line_data:
-                                # Skip if no data or time point outside simulation range
-                                if len(x_data) == 0 or time_point < x_data[0] or time_point > x_data[-1]:
-                                    row.append('')
-                                    continue
-                                
-                                # Find the closest index
-                                idx = np.abs(x_data - time_point).argmin()
-                                
-                                # If we have an exact match (or close enough)
-                                if abs(x_data[idx] - time_point) < longest_sim_step/10:
-                                    row.append(y_data[idx])
-                                else:
-                                    # Need to interpolate
-                                    if idx > 0 and idx < len(x_data) - 1:
-                                        # Find the bracketing indices
-                                        if x_data[idx] > time_point:
-                                            # Point between idx-1 and idx
-                                            idx_low, idx_high = idx-1, idx
-                                        else:
-                                            # Point between idx and idx+1
-                                            idx_low, idx_high = idx, idx+1
-                                            
-                                        # Linear interpolation
-                                        t = (time_point - x_data[idx_low]) / (x_data[idx_high] - x_data[idx_low])
-                                        interp_value = y_data[idx_low] + t * (y_data[idx_high] - y_data[idx_low])
-                                        row.append(interp_value)
-                                    else:
-                                        # Use nearest value if interpolation not possible
-                                        row.append(y_data[idx])
-                                
-                            writer.writerow(row)
+                        # Resample every line onto the uniform grid and write the columns in one go,
+                        # leaving cells empty where a line has no data
+                        columns = [_resample_to_time_points(x_data, y_data, uniform_time_points, longest_sim_step/10)
+                                   for x_data, y_data in line_data]
+                        _write_csv_table(csvfile, uniform_time_points, columns)
                 
                 debug_print(f"Data exported to {file_path}")
                     
@@ -1095,6 +1780,14 @@ class ResultsTabSuite(QWidget):
             # Always remove the graph from the exporting set when done
             self.exporting_graphs.discard(graph_id)
 
+    @staticmethod
+    def _write_csv_rows(file_path, rows, time_points=None, columns=()):
+        """Write a list of rows, then optional resampled columns (see _write_csv_table), to a new CSV file"""
+        with open(file_path, 'w', newline='') as csvfile:
+            csv.writer(csvfile).writerows(rows)
+            if time_points is not None:
+                _write_csv_table(csvfile, time_points, columns)
+    
     def export_all_to_csv(self):
         """Export data from all graphs to a single directory"""
         if not self.graph_widget.graphs:
@@ -1114,7 +1807,6 @@ class ResultsTabSuite(QWidget):
             return
         
         # Create a subdirectory with timestamp
-        import time
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         export_dir = os.path.join(dir_path, f"graph_export_{timestamp}")
         
@@ -1122,6 +1814,7 @@ class ResultsTabSuite(QWidget):
             os.makedirs(export_dir, exist_ok=True)
             
             # Export each graph
+            exports = []  # (file path, header rows, time points, resampled columns) per graph
             for i, graph in enumerate(self.graph_widget.graphs):
                 # Get selected variables for this graph
                 selected = graph.get_selected_variables()
@@ -1136,122 +1829,99 @@ class ResultsTabSuite(QWidget):
                 safe_title = "".join(c if c.isalnum() else "_" for c in title)
                 file_path = os.path.join(export_dir, f"{safe_title}.csv")
                 
-                with open(file_path, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header row with metadata
-                    writer.writerow(["Graph Title:", title])
-                    writer.writerow(["X-Axis:", x_var, selected['x_label']])
-                    writer.writerow(["Y-Axis:", y_var, selected['y_label']])
-                    writer.writerow([])  # Empty row
-                    
-                    # Data header row
-                    header = [x_var]
-                    sim_names = []
-                    
-                    for sim_hash in self.selected_simulations:
-                        if sim_hash in self.simulation_data:
-                            sim_name = self.simulation_data[sim_hash]['display_name']
-                            sim_names.append(sim_name)
-                            header.append(f"{sim_name} - {y_var}")
-                    
-                    writer.writerow(header)
-                    
-                    # Load x and y data for all simulations
-                    sim_data = []
-                    sim_durations = []
-                    time_steps = []
-                    global_start = float('inf')
-                    global_end = 0
-                    
-                    for sim_hash in self.selected_simulations:
-                        if sim_hash not in self.simulation_data:
-                            continue
-                            
-                        # Lazy load the data for this simulation
-                        x_data = self.get_simulation_variable(sim_hash, x_var, current_graph=None)
-                        y_data = self.get_simulation_variable(sim_hash, y_var, current_graph=None)
-                        
-                        if x_data is not None and y_data is not None and len(x_data) > 0:
-                            # Only keep data where both x and y are valid
-                            min_length = min(len(x_data), len(y_data))
-                            x_data = x_data[:min_length]
-                            y_data = y_data[:min_length]
-                            
-                            # Calculate simulation duration
-                            duration = x_data[-1] - x_data[0]
-                            sim_durations.append(duration)
-                            
-                            # Calculate average time step
-                            if len(x_data) > 1:
-                                avg_step = duration / (len(x_data) - 1)
-                                time_steps.append(avg_step)
-                            
-                            # Update global range
-                            global_start = min(global_start, x_data[0])
-                            global_end = max(global_end, x_data[-1])
-                            
-                            # Store the data
-                            sim_data.append((sim_hash, x_data, y_data))
-                    
-                    # Find the longest simulation - it will have the largest time step
-                    if not sim_durations:
-                        debug_print("No valid simulation data found")
+                # Header rows are collected here; the files are written together below
+                rows = []
+                
+                # Write header row with metadata
+                rows.append(["Graph Title:", title])
+                rows.append(["X-Axis:", x_var, selected['x_label']])
+                rows.append(["Y-Axis:", y_var, selected['y_label']])
+                rows.append([])  # Empty row
+                
+                # Data header row
+                header = [x_var]
+                sim_names = []
+                
+                for sim_hash in self.selected_simulations:
+                    if sim_hash in self.simulation_data:
+                        sim_name = self.simulation_data[sim_hash]['display_name']
+                        sim_names.append(sim_name)
+                        header.append(f"{sim_name} - {y_var}")
+                
+                rows.append(header)
+                
+                # Load x and y data for all simulations
+                sim_data = []
+                sim_durations = []
+                time_steps = []
+                global_start = float('inf')
+                global_end = 0
+                
+                for sim_hash in self.selected_simulations:
+                    if sim_hash not in self.simulation_data:
                         continue
                         
-                    longest_sim_idx = np.argmax(sim_durations)
-                    longest_duration = sim_durations[longest_sim_idx]
-                    
-                    # Use the time step from the longest simulation
-                    if time_steps:
-                        longest_sim_step = time_steps[longest_sim_idx]
-                    else:
-                        longest_sim_step = 0.1  # Default if no step could be determined
+                    # Lazy load the data for this simulation
+                    x_data = self.get_simulation_variable(sim_hash, x_var, current_graph=None)
+                    y_data = self.get_simulation_variable(sim_hash, y_var, current_graph=None)
                     
-                    # Generate a consistent timeline using the longest simulation's step size
-                    if global_start != float('inf'):
-                        # Create time points using the longest simulation's time step
-                        uniform_time_points = np.arange(global_start, global_end + longest_sim_step/2, longest_sim_step)
+                    if x_data is not None and y_data is not None and len(x_data) > 0:
+                        # Only keep data where both x and y are valid
+                        min_length = min(len(x_data), len(y_data))
+                        x_data = x_data[:min_length]
+                        y_data = y_data[:min_length]
                         
-                        # Remove any duplicate times from floating point rounding
-                        uniform_time_points = np.unique(np.round(uniform_time_points, 10))
+                        # Calculate simulation duration
+                        duration = x_data[-1] - x_data[0]
+                        sim_durations.append(duration)
                         
-                        # For each time point in our uniform grid, get data from all simulations
-                        for time_point in uniform_time_points:
-                            row = [time_point]  # First add the X value
-                            
-                            for sim_hash, x_data, y_data in sim_data:
-                                # Skip if time point outside simulation range
-                                if time_point < x_data[0] or time_point > x_data[-1]:
-                                    row.append('')
-                                    continue
-                                
-                                # Find the closest index
-                                idx = np.abs(x_data - time_point).argmin()
-                                
-                                # If we have an exact match (or close enough)
-                                if abs(x_data[idx] - time_point) < longest_sim_step/10:
-                                    row.append(y_data[idx])
-                                else:
-                                    # Need to interpolate
-                                    if idx > 0 and idx < len(x_data) - 1:
-                                        # Find the bracketing indices
-                                        if x_data[idx] > time_point:
-                                            # Point between idx-1 and idx
-                                            idx_low, idx_high = idx-1, idx
-                                        else:
-                                            # Point between idx and idx+1
-                                            idx_low, idx_high = idx, idx+1
-                                            
-                                        # Linear interpolation
-                                        t = (time_point - x_data[idx_low]) / (x_data[idx_high] - x_data[idx_low])
-                                        interp_value = y_data[idx_low] + t * (y_data[idx_high] - y_data[idx_low])
-                                        row.append(interp_value)
-                                    else:
-                                        # Use nearest value if interpolation not possible
-                                        row.append(y_data[idx])
-                            
-                            writer.writerow(row)
+                        # Calculate average time step
+                        if len(x_data) > 1:
+                            avg_step = duration / (len(x_data) - 1)
+                            time_steps.append(avg_step)
+                        
+                        # Update global range
+                        global_start = min(global_start, x_data[0])
+                        global_end = max(global_end, x_data[-1])
+                        
+                        # Store the data
+                        sim_data.append((sim_hash, x_data, y_data))
+                
+                # Find the longest simulation - it will have the largest time step
+                if not sim_durations:
+                    debug_print("No valid simulation data found")
+                    exports.append((file_path, rows, None, ()))
+                    continue
+                    
+                longest_sim_idx = np.argmax(sim_durations)
+                longest_duration = sim_durations[longest_sim_idx]
+                
+                # Use the time step from the longest simulation
+                if time_steps:
+                    longest_sim_step = time_steps[longest_sim_idx]
+                else:
+                    longest_sim_step = 0.1  # Default if no step could be determined
+                
+                # Generate a consistent timeline using the longest simulation's step size
+                if global_start != float('inf'):
+                    # Create time points using the longest simulation's time step
+                    uniform_time_points = np.arange(global_start, global_end + longest_sim_step/2, longest_sim_step)
+                    
+                    # Remove any duplicate times from floating point rounding
+                    uniform_time_points = np.unique(np.round(uniform_time_points, 10))
+                    
+                    # Resample every simulation onto the uniform grid, one column each
+                    columns = [_resample_to_time_points(x_data, y_data, uniform_time_points, longest_sim_step/10)
+                               for _, x_data, y_data in sim_data]
+                    exports.append((file_path, rows, uniform_time_points, columns))
+        
+            # Resampling reads the shared data cache, so it stays on this thread;
+            # formatting and writing the files are independent and go to a thread pool
+            if exports:
+                with ThreadPoolExecutor(max_workers=min(4, len(exports))) as executor:
+                    futures = [executor.submit(self._write_csv_rows, *export) for export in exports]
+                    for future in futures:
+                        future.result()
             
             debug_print(f"All graph data exported to {export_dir}")
                 
@@ -1265,6 +1935,11 @@ class ResultsTabSuite(QWidget):
         Refresh the simulations data when simulations are added/removed.
         Note: Only simulations that have been run will be shown in the list.
         """
+        # Cached similarity groups may refer to data that has changed on disk
+        self._similarity_cache.clear()
+        for graph in self.graph_widget.graphs:
+            graph._plot_signature = None
+        
         # Reload simulations from the suite
         if self.suite:
             self.load_suite_simulations(self.suite)
@@ -1287,7 +1962,7 @@ class ResultsTabSuite(QWidget):
                               "No simulations selected.\n"
                               "Select simulations from the list on the left.",
                               ha='center', va='center', fontsize=12)
-                graph.canvas.draw() 
+                graph.canvas.draw_idle()
 
     def save_graph_to_png(self, graph):
         """Save a specific graph to PNG file"""
@@ -1303,8 +1978,8 @@ class ResultsTabSuite(QWidget):
             sim_hash: The hash of the simulation
             
         Returns:
-            A list of section tuples, each containing (section_title, parameter_dict)
-            where parameter_dict is a dictionary of parameter names and values
+            The display name and a list of section tuples, each containing (section_title, params)
+            where params is a tuple of (parameter name, value) pairs
         """
         sim_data = self.simulation_data.get(sim_hash, {})
         display_name = sim_data.get('display_name', 'Unknown Simulation')
@@ -1327,8 +2002,7 @@ class ResultsTabSuite(QWidget):
         # Check if config.json exists and load complete config
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    config_json = json.load(f)
+                config_json = _load_config_cached(config_path, os.path.getmtime(config_path))
                 
                 # Extract main sections
                 metadata = config_json.get('metadata', {})
@@ -1355,7 +2029,7 @@ class ResultsTabSuite(QWidget):
                 for species_name, species_info in species_data.items():
                     if isinstance(species_info, dict):
                         # Format the species name for display
-                        display_species_name = species_name.upper() if len(species_name) <= 2 else species_name.capitalize()
+                        display_species_name = _ion_display(species_name)
                         
                         # Get concentrations and format them
                         vesicle_conc = species_info.get('init_vesicle_conc', 0.0)
@@ -1383,86 +2057,63 @@ class ResultsTabSuite(QWidget):
                 channels_data = simulation_data.get('channels', {})
                 for channel_name, channel_info in channels_data.items():
                     if isinstance(channel_info, dict):
-                        # Format display name
-                        display_channel_name = channel_info.get('display_name', channel_name.upper())
+                        get = channel_info.get
+                        
+                        # Format display name; every row label starts with it
+                        display_channel_name = get('display_name', channel_name.upper())
+                        prefix = f"{display_channel_name} "
                         
                         # Get basic channel properties
-                        conductance = channel_info.get('conductance', 0.0)
-                        channel_type = channel_info.get('channel_type', 'Unknown')
-                        dependence_type = channel_info.get('dependence_type', 'None')
+                        conductance = get('conductance', 0.0)
+                        channel_type = get('channel_type', 'Unknown')
+                        dependence_type = get('dependence_type', 'None')
                         
                         # Create channel entry
-                        channel_params[f"{display_channel_name} Conductance"] = f"{conductance:.2e} S"
-                        channel_params[f"{display_channel_name} Type"] = f"{channel_type}"
+                        channel_params[prefix + "Conductance"] = f"{conductance:.2e} S"
+                        channel_params[prefix + "Type"] = f"{channel_type}"
                         
                         if dependence_type:
                             # Add dependency type
-                            channel_params[f"{display_channel_name} Dependence"] = f"{dependence_type}"
+                            channel_params[prefix + "Dependence"] = f"{dependence_type}"
                             
                             # Add specific dependency parameters to the dependencies section
-                            if 'voltage' in dependence_type:
-                                # Voltage dependence parameters
-                                voltage_exponent = channel_info.get('voltage_exponent')
-                                half_act_voltage = channel_info.get('half_act_voltage')
-                                voltage_multiplier = channel_info.get('voltage_multiplier')
-                                
-                                if voltage_exponent is not None:
-                                    channel_dependency_params[f"{display_channel_name} V Exponent"] = f"{voltage_exponent}"
-                                if half_act_voltage is not None:
-                                    channel_dependency_params[f"{display_channel_name} Half-Act V"] = f"{half_act_voltage:.3f} V"
-                                if voltage_multiplier is not None:
-                                    channel_dependency_params[f"{display_channel_name} V Multiplier"] = f"{voltage_multiplier}"
-                            
-                            if 'pH' in dependence_type:
-                                # pH dependence parameters
-                                pH_exponent = channel_info.get('pH_exponent')
-                                half_act_pH = channel_info.get('half_act_pH')
-                                
-                                if pH_exponent is not None:
-                                    channel_dependency_params[f"{display_channel_name} pH Exponent"] = f"{pH_exponent}"
-                                if half_act_pH is not None:
-                                    channel_dependency_params[f"{display_channel_name} Half-Act pH"] = f"{half_act_pH:.2f}"
-                            
-                            if dependence_type == 'time':
-                                # Time dependence parameters
-                                time_exponent = channel_info.get('time_exponent')
-                                half_act_time = channel_info.get('half_act_time')
-                                
-                                if time_exponent is not None:
-                                    channel_dependency_params[f"{display_channel_name} Time Exponent"] = f"{time_exponent}"
-                                if half_act_time is not None:
-                                    channel_dependency_params[f"{display_channel_name} Half-Act Time"] = f"{half_act_time:.3f} s"
+                            for applies_to, rows in _DEPENDENCE_SPECS:
+                                if applies_to(dependence_type):
+                                    for config_key, label, format_value in rows:
+                                        value = get(config_key)
+                                        if value is not None:
+                                            channel_dependency_params[prefix + label] = format_value(value)
                         
                         # Additional channel parameters
-                        nernst_multiplier = channel_info.get('nernst_multiplier')
-                        flux_multiplier = channel_info.get('flux_multiplier')
-                        voltage_shift = channel_info.get('voltage_shift')
+                        nernst_multiplier = get('nernst_multiplier')
+                        flux_multiplier = get('flux_multiplier')
+                        voltage_shift = get('voltage_shift')
                         
                         if nernst_multiplier is not None:
-                            channel_params[f"{display_channel_name} Nernst Mult."] = f"{nernst_multiplier}"
+                            channel_params[prefix + "Nernst Mult."] = f"{nernst_multiplier}"
                         if flux_multiplier is not None:
-                            channel_params[f"{display_channel_name} Flux Mult."] = f"{flux_multiplier}"
+                            channel_params[prefix + "Flux Mult."] = f"{flux_multiplier}"
                         if voltage_shift is not None and voltage_shift != 0:
-                            channel_dependency_params[f"{display_channel_name} V Shift"] = f"{voltage_shift:.3f} V"
+                            channel_dependency_params[prefix + "V Shift"] = _FMT_VOLTS(voltage_shift)
                         
                         # Add ion specificity
-                        primary_ion = channel_info.get('allowed_primary_ion', '')
-                        secondary_ion = channel_info.get('allowed_secondary_ion', '')
+                        primary_ion = get('allowed_primary_ion', '')
+                        secondary_ion = get('allowed_secondary_ion', '')
                         
                         if primary_ion:
-                            channel_params[f"{display_channel_name} Primary Ion"] = primary_ion.upper() if len(primary_ion) <= 2 else primary_ion.capitalize()
+                            channel_params[prefix + "Primary Ion"] = _ion_display(primary_ion)
                         
                         if secondary_ion:
-                            channel_params[f"{display_channel_name} Secondary Ion"] = secondary_ion.upper() if len(secondary_ion) <= 2 else secondary_ion.capitalize()
+                            channel_params[prefix + "Secondary Ion"] = _ion_display(secondary_ion)
                         
                         # Ion exponents if available
-                        primary_exponent = channel_info.get('primary_exponent')
-                        secondary_exponent = channel_info.get('secondary_exponent')
+                        primary_exponent = get('primary_exponent')
+                        secondary_exponent = get('secondary_exponent')
                         
                         if primary_exponent is not None and primary_exponent != 1:
-                            channel_params[f"{display_channel_name} Primary Exp."] = f"{primary_exponent}"
+                            channel_params[prefix + "Primary Exp."] = f"{primary_exponent}"
                         if secondary_exponent is not None and secondary_exponent != 1:
-                            channel_params[f"{display_channel_name} Secondary Exp."] = f"{secondary_exponent}"
+                            channel_params[prefix + "Secondary Exp."] = f"{secondary_exponent}"
                 
                 # Skipping Ion-Channel Links section as requested by user
                 
@@ -1471,20 +2122,21 @@ class ResultsTabSuite(QWidget):
                 import traceback
                 traceback.print_exc()
         
-        # Return the organized sections - excluding Basic Information and Ion-Channel Links
+        # Return the organized sections - excluding Basic Information and Ion-Channel Links.
+        # Parameters are frozen into (name, value) pairs once, as every consumer only iterates them
         sections = []
         
         if simulation_params:
-            sections.append(("Simulation Parameters", simulation_params))
+            sections.append(("Simulation Parameters", tuple(simulation_params.items())))
             
         if ion_species_params:
-            sections.append(("Ion Species", ion_species_params))
+            sections.append(("Ion Species", tuple(ion_species_params.items())))
             
         if channel_params:
-            sections.append(("Ion Channels", channel_params))
+            sections.append(("Ion Channels", tuple(channel_params.items())))
             
         if channel_dependency_params:
-            sections.append(("Channel Dependencies", channel_dependency_params))
+            sections.append(("Channel Dependencies", tuple(channel_dependency_params.items())))
         
         return display_name, sections
     
@@ -1501,6 +2153,9 @@ class ResultsTabSuite(QWidget):
         if not sim_hashes:
             return
         
+        # Every parameter page has the same size, so one figure is cleared and reused for all of them;
+        # it is a plain Figure rather than a pyplot one, so no GUI window is created for it
+        fig = Figure(figsize=(8.5, 11))
         # Process each simulation
         for i, sim_hash in enumerate(sim_hashes):
             # Get parameters for this simulation
@@ -1518,25 +2173,30 @@ class ResultsTabSuite(QWidget):
             # For very large tables, split into multiple pages
             if total_rows <= 30:
                 # Small table - comfortable single page with larger font
-                self._add_single_page_parameters(pdf, display_name, sections)
+                self._add_single_page_parameters(pdf, display_name, sections, fig=fig)
             elif total_rows <= 50:
                 # Medium table - still use single page but with smaller font
-                self._add_single_page_parameters(pdf, display_name, sections)
+                self._add_single_page_parameters(pdf, display_name, sections, fig=fig)
             else:
                 # Large table - multiple pages needed
-                self._add_multi_page_parameters(pdf, display_name, sections)
+                self._add_multi_page_parameters(pdf, display_name, sections, fig=fig)
     
-    def _add_single_page_parameters(self, pdf, display_name, sections):
+    def _add_single_page_parameters(self, pdf, display_name, sections, fig=None):
         """
         Add a single page with all parameter sections.
         
         Args:
             pdf: The PdfPages object
             display_name: The name of the simulation
-            sections: List of (section_title, params_dict) tuples
+            sections: List of (section_title, params) tuples, params being (name, value) pairs
+            fig: Optional 8.5x11 figure to clear and draw on instead of creating one
         """
-        # Create a figure with a bit more height
-        fig = plt.figure(figsize=(8.5, 11))
+        # Create a figure with a bit more height, or start over on the one we were given
+        owns_fig = fig is None
+        if owns_fig:
+            fig = plt.figure(figsize=(8.5, 11))
+        else:
+            fig.clf()
         
         # Add a title for this simulation
         fig.suptitle(f"Parameters for: {display_name}", fontsize=14, y=0.98)
@@ -1548,14 +2208,16 @@ class ResultsTabSuite(QWidget):
         
         # Combine all sections into a single table with section headers
         all_rows = []
+        header_rows = []
         
         # Process each section
         for section_idx, (section_title, params) in enumerate(sections):
             # Add a section header row
+            header_rows.append(len(all_rows))
             all_rows.append([section_title, ""])
             
             # Add parameter rows for this section
-            for key, value in params.items():
+            for key, value in params:
                 all_rows.append([key, str(value)])
         
         # Create a single table with all rows
@@ -1581,37 +2243,37 @@ class ResultsTabSuite(QWidget):
         table.set_fontsize(font_size)
         
         # Apply styling to header rows
-        row_idx = 0
-        for section_idx, (section_title, params) in enumerate(sections):
-            # Get the table cells for the header row
-            header_cells = [table._cells[(row_idx, 0)], table._cells[(row_idx, 1)]]
-            
-            # Style the header cells
-            for cell in header_cells:
-                cell.set_text_props(weight='bold', color='white')
-                cell.set_facecolor('#4472C4')  # Blue header
-            
-            # Center the title in the first cell
-            header_cells[0].set_text_props(ha='center')
-            
-            # Hide the text in the second cell (for visual merge effect)
-            header_cells[1].set_text_props(alpha=0)
-            
-            # Move to the next rows for this section (1 header + parameter rows)
-            row_idx += len(params) + 1
+        self._style_parameter_header_rows(table, header_rows)
         
         # Save this simulation's page
         pdf.savefig(fig)
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
+    
+    @staticmethod
+    def _style_parameter_header_rows(table, header_rows):
+        """Style the given rows of a parameter table as blue section headers"""
+        cells = table.get_celld()
+        for row in header_rows:
+            title_cell, blank_cell = cells[(row, 0)], cells[(row, 1)]
+            
+            # Bold white title centered in the first cell
+            title_cell.set_text_props(weight='bold', color='white', ha='center')
+            title_cell.set_facecolor('#4472C4')  # Blue header
+            
+            # Hide the text in the second cell (for visual merge effect)
+            blank_cell.set_text_props(weight='bold', color='white', alpha=0)
+            blank_cell.set_facecolor('#4472C4')
     
-    def _add_multi_page_parameters(self, pdf, display_name, sections):
+    def _add_multi_page_parameters(self, pdf, display_name, sections, fig=None):
         """
         Add multiple pages for parameter sections when they don't fit on one page.
         
         Args:
             pdf: The PdfPages object
             display_name: The name of the simulation
-            sections: List of (section_title, params_dict) tuples
+            sections: List of (section_title, params) tuples, params being (name, value) pairs
+            fig: Optional 8.5x11 figure to clear and reuse for every page
         """
         # Count total number of rows (all parameters + section headers)
         total_rows = sum(len(params) + 1 for _, params in sections)
@@ -1619,7 +2281,7 @@ class ResultsTabSuite(QWidget):
         # If everything can fit on a single page, don't split
         # A standard page can typically fit around 50-55 rows comfortably with smaller font
         if total_rows <= 50:
-            self._add_single_page_parameters(pdf, display_name, sections)
+            self._add_single_page_parameters(pdf, display_name, sections, fig=fig)
             return
         
         # Maximum rows that can fit on a page - increased from 40 to 50
@@ -1627,71 +2289,35 @@ class ResultsTabSuite(QWidget):
         
         # Create a list of all rows that need to be displayed
         all_rows_data = []
-        section_start_indices = {}  # Track where each section starts
-        section_sizes = {}  # Track size of each section
+        section_starts = []  # Row index of each section's header, in increasing order
         
         # First, collect all rows data and track section boundaries
         for section_title, params in sections:
             # Record the start index of this section
-            section_start_indices[section_title] = len(all_rows_data)
-            section_sizes[section_title] = len(params) + 1  # +1 for header row
+            section_starts.append(len(all_rows_data))
             
             # Add the section header row
             all_rows_data.append(("header", section_title, ""))
             
             # Add all parameter rows
-            for key, value in params.items():
+            for key, value in params:
                 all_rows_data.append(("param", key, value))
         
         # Create pages with smarter page breaks
-        page_num = 0
         idx = 0  # Current position in all_rows_data
         page_breaks = []  # Store the indices where pages should break
         
-        # Find optimal page breaks trying to keep sections together when possible
+        # Find page breaks, keeping sections together when possible
         while idx < len(all_rows_data):
             # Default page break if we hit the maximum
             next_idx = min(idx + max_rows_per_page, len(all_rows_data))
             
-            # If we're not at the end and this break would split a section,
-            # try to find a better break point
+            # If we're not at the end, break before the last section that starts on this
+            # page instead; a section longer than a page is simply cut at the maximum
             if next_idx < len(all_rows_data):
-                # Look backward from the default break to find a section boundary
-                for i in range(next_idx, idx, -1):
-                    # Check if this point is a section start
-                    is_section_start = False
-                    for section, start_idx in section_start_indices.items():
-                        if i == start_idx:
-                            is_section_start = True
-                            break
-                    
-                    if is_section_start:
-                        # Found a section start - break here instead
-                        next_idx = i
-                        break
-                        
-                    # See if this row is a header - if so, we're at the start of a section
-                    if i < len(all_rows_data) and all_rows_data[i][0] == "header":
-                        next_idx = i
-                        break
-                
-                # If we couldn't find a good break point and would split a small section,
-                # check if we can include the whole section instead
-                if all_rows_data[next_idx][0] == "param":
-                    # We're in the middle of a section
-                    # See if the current row is part of a section that started recently
-                    for section, start_idx in section_start_indices.items():
-                        if start_idx < next_idx and next_idx - start_idx < max_rows_per_page // 4:
-                            # Small part of a section would be split - check if we can fit the whole section
-                            section_size = section_sizes.get(section, 0)
-                            
-                            # Find the end of this section
-                            section_end = start_idx + section_size
-                            
-                            # If the section isn't too large, include it all on this page
-                            if section_end - idx <= max_rows_per_page * 1.1:  # Allow 10% overflow
-                                next_idx = section_end
-                                break
+                last_start = section_starts[bisect.bisect_right(section_starts, next_idx) - 1]
+                if last_start > idx:
+                    next_idx = last_start
             
             # Add the page break
             page_breaks.append(next_idx)
@@ -1703,6 +2329,9 @@ class ResultsTabSuite(QWidget):
         # Calculate total pages
         total_pages = len(page_breaks) - 1
         
+        owns_fig = fig is None
+        page_fig = fig
+        
         # Create pages based on the calculated breaks
         for page_num in range(total_pages):
             start_idx = page_breaks[page_num]
@@ -1711,8 +2340,12 @@ class ResultsTabSuite(QWidget):
             # Get rows for this page
             page_rows = all_rows_data[start_idx:end_idx]
             
-            # Create a figure for this page
-            fig = plt.figure(figsize=(8.5, 11))
+            # Draw each page on the same figure, cleared in between
+            if page_fig is None:
+                page_fig = plt.figure(figsize=(8.5, 11))
+            else:
+                page_fig.clf()
+            fig = page_fig
             
             # Add a title (with page number)
             title = f"Parameters for: {display_name} (Page {page_num+1}/{total_pages})"
@@ -1722,31 +2355,15 @@ class ResultsTabSuite(QWidget):
             ax = fig.add_axes([0.05, 0.02, 0.9, 0.91])  # Use more page space
             ax.axis('off')
             
-            # Prepare data for the table
+            # Prepare data for the table, noting the header rows in the same pass
             table_data = []
-            section_rows = {}  # Track rows for each section on this page
-            current_section = None
-            
-            # Process rows for this page
-            for row_type, col1, col2 in page_rows:
+            header_indices = []
+            for i, (row_type, col1, col2) in enumerate(page_rows):
                 if row_type == "header":
-                    # This is a section header
-                    current_section = col1
-                    # Check if this is a continuation
-                    if start_idx > 0 and section_start_indices.get(current_section, 0) < start_idx:
-                        table_data.append([f"{col1} (continued)", ""])
-                    else:
-                        table_data.append([col1, ""])
-                    
-                    # Initialize section row tracking
-                    section_rows[current_section] = []
+                    header_indices.append(i)
+                    table_data.append([col1, ""])
                 else:
-                    # This is a parameter row
                     table_data.append([col1, col2])
-                    
-                    # Track the row for this section
-                    if current_section is not None:
-                        section_rows.setdefault(current_section, []).append(len(table_data) - 1)
             
             # Create a single table with all rows
             table = ax.table(
@@ -1763,25 +2380,30 @@ class ResultsTabSuite(QWidget):
             table.set_fontsize(font_size)
             
             # Apply styling to section headers
-            for i, (row_type, col1, col2) in enumerate(page_rows):
-                if row_type == "header":
-                    # Style header cells
-                    header_cells = [table._cells[(i, 0)], table._cells[(i, 1)]]
-                    
-                    for cell in header_cells:
-                        cell.set_text_props(weight='bold', color='white')
-                        cell.set_facecolor('#4472C4')  # Blue header
-                    
-                    # Center the title in the first cell
-                    header_cells[0].set_text_props(ha='center')
-                    
-                    # Hide the text in the second cell
-                    header_cells[1].set_text_props(alpha=0)
+            self._style_parameter_header_rows(table, header_indices)
             
             # Save this page
             pdf.savefig(fig)
-            plt.close(fig)
+        
+        if owns_fig and page_fig is not None:
+            plt.close(page_fig)
 
+    @staticmethod
+    def _copy_lines_to_axes(source_axes, ax):
+        """Add a copy of every line on source_axes to ax, then autoscale ax once
+        
+        The new lines share the source data arrays and keep their color, line style, marker
+        and label. They are added directly rather than through ax.plot, which would
+        re-validate the data and autoscale for each line.
+        """
+        for line in source_axes.lines:
+            ax.add_line(Line2D(line.get_xdata(), line.get_ydata(),
+                               color=line.get_color(),
+                               linestyle=line.get_linestyle(),
+                               marker=line.get_marker(),
+                               label=line.get_label()))
+        ax.autoscale_view()
+    
     def save_all_to_pdf(self):
         """Export all graphs to a single PDF file"""
         if not self.graph_widget.graphs:
@@ -1813,8 +2435,9 @@ class ResultsTabSuite(QWidget):
             file_path += '.pdf'
         
         try:
-            # Create a PdfPages object
-            with PdfPages(file_path) as pdf:
+            # Create a PdfPages object; document-level metadata is set once up front
+            with PdfPages(file_path, metadata={'Title': 'Simulation Results',
+                                               'Creator': 'MP Volume Simulator'}) as pdf:
                 # Count how many graphs have data
                 graphs_with_data = [graph for graph in self.graph_widget.graphs if graph.axes.lines]
                 total_graphs = len(graphs_with_data)
@@ -1825,7 +2448,7 @@ class ResultsTabSuite(QWidget):
                     progress.setLabelText("Writing summary page...")
                     progress.setValue(25)
                     QApplication.processEvents()
-                    fig = plt.figure(figsize=(8, 6))
+                    fig = Figure(figsize=(8, 6))
                     ax = fig.add_subplot(111)
                     ax.axis('off')
                     ax.text(0.5, 0.6, "No graphs were plotted",
@@ -1833,7 +2456,6 @@ class ResultsTabSuite(QWidget):
                     ax.text(0.5, 0.45, "Parameter tables for selected simulations follow.",
                             ha='center', va='center', fontsize=10)
                     pdf.savefig(fig)
-                    plt.close(fig)
 
                     # Always include parameter tables
                     progress.setLabelText("Adding parameter tables...")
@@ -1843,10 +2465,8 @@ class ResultsTabSuite(QWidget):
 
                     # Set PDF metadata
                     d = pdf.infodict()
-                    d['Title'] = 'Simulation Results'
                     d['Subject'] = 'Parameters for selected simulations'
                     d['Keywords'] = 'matplotlib, simulations, parameters'
-                    d['Creator'] = 'MP Volume Simulator'
 
                     debug_print(f"Parameter tables exported to PDF: {file_path}")
                     progress.setValue(100)
@@ -1864,6 +2484,15 @@ class ResultsTabSuite(QWidget):
                 progress.setValue(5)
                 QApplication.processEvents()
                 
+                # Read what each page needs from the graph widgets once, up front:
+                # (source axes, title, x label, y label, whether it has a legend)
+                prepared = []
+                for i, graph in enumerate(graphs_with_data):
+                    selected = graph.get_selected_variables()
+                    prepared.append((graph.axes, selected.get('title', f"Graph {i+1}"),
+                                     graph.axes.get_xlabel(), graph.axes.get_ylabel(),
+                                     graph.axes.get_legend() is not None))
+                
                 # Process each page
                 for page in range(num_pages):
                     progress.setValue(5 + int(80 * (page / max(1, num_pages))))
@@ -1871,153 +2500,45 @@ class ResultsTabSuite(QWidget):
                     # Get graphs for this page
                     start_idx = page * graphs_per_page
                     end_idx = min(start_idx + graphs_per_page, total_graphs)
-                    page_graphs = graphs_with_data[start_idx:end_idx]
+                    page_graphs = prepared[start_idx:end_idx]
                     graphs_on_page = len(page_graphs)
                     
-                    debug_print(f"Page {page+1}: Creating layout for {graphs_on_page} graphs")
-                    
-                    # Create a new figure for this page
-                    if graphs_on_page <= 1:
-                        # Single graph case - use the original aspect ratio
-                        fig = plt.figure(figsize=(10, 7))
-                        # Adjust margins to center the plot nicely on the page
+                    if app_settings.DEBUG_LOGGING:
+                        debug_print(f"Page {page+1}: Creating layout for {graphs_on_page} graphs")
+                    
+                    # Create a new figure for this page from the layout for its graph count; pages
+                    # are only rendered into the PDF, so they don't go through pyplot and its Qt windows
+                    figsize, grid_spec, positions = _PDF_PAGE_LAYOUTS[graphs_on_page]
+                    fig = Figure(figsize=figsize)
+                    if grid_spec is None:
+                        # Single graph case - use the original aspect ratio, with margins that
+                        # center the plot nicely on the page
                         fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.15)
-                        ax = fig.add_subplot(111)
-                        
-                        # Get data from the original graph
-                        graph = page_graphs[0]
-                        selected = graph.get_selected_variables()
-                        title = selected.get('title', f"Graph {start_idx+1}")
-                        
-                        # Copy lines, labels, and other elements from original
-                        for line in graph.axes.lines:
-                            ax.plot(line.get_xdata(), line.get_ydata(), 
-                                   color=line.get_color(), 
-                                   linestyle=line.get_linestyle(),
-                                   marker=line.get_marker(),
-                                   label=line.get_label())
-                        
-                        ax.set_title(title)
-                        ax.set_xlabel(graph.axes.get_xlabel())
-                        ax.set_ylabel(graph.axes.get_ylabel())
-                        ax.grid(True, linestyle='--', alpha=0.7)
-                        
-                        # Add legend if needed
-                        if graph.axes.get_legend() is not None:
-                            ax.legend(fontsize='small', framealpha=0.9, loc='best')
-                        
-                    elif graphs_on_page == 2:
-                        # 2 graphs - stacked vertically with good aspect ratio
-                        fig = plt.figure(figsize=(10, 11))
-                        
-                        # Use GridSpec for better control over spacing
-                        from matplotlib.gridspec import GridSpec
-                        gs = GridSpec(2, 1, figure=fig, height_ratios=[1, 1], hspace=0.3)
-                        
-                        ax1 = fig.add_subplot(gs[0, 0])
-                        ax2 = fig.add_subplot(gs[1, 0])
-                        
-                        axs = [ax1, ax2]
-                    
-                    elif graphs_on_page <= 4:
-                        # 3-4 graphs - use 2x2 grid with wider aspect ratio
-                        fig = plt.figure(figsize=(12, 9))  # Wider figure to accommodate wider graphs
-                        
-                        # Use GridSpec for better control over spacing
-                        from matplotlib.gridspec import GridSpec
-                        # Make width ratios larger than height ratios for wider graphs
-                        gs = GridSpec(2, 2, figure=fig, 
-                                    height_ratios=[1, 1], 
-                                    width_ratios=[1.5, 1.5],  # Wider graphs
-                                    hspace=0.35, wspace=0.25)  # Adjust spacing
-                        
-                        if graphs_on_page == 3:
-                            # For 3 graphs: Use 3 positions in the 2x2 grid as would be used for 4 graphs
-                            # Top left
-                            ax1 = fig.add_subplot(gs[0, 0])
-                            # Top right
-                            ax2 = fig.add_subplot(gs[0, 1])
-                            # Bottom left
-                            ax3 = fig.add_subplot(gs[1, 0])
-                            # Leave bottom right empty
-                            
-                            axs = [ax1, ax2, ax3]
-                        elif graphs_on_page == 5:
-                            # For 5 graphs: Use 5 positions in the 3x2 grid as would be used for 6 graphs
-                            # Top row - left
-                            ax1 = fig.add_subplot(gs[0, 0])
-                            # Top row - right
-                            ax2 = fig.add_subplot(gs[0, 1])
-                            # Middle row - left
-                            ax3 = fig.add_subplot(gs[1, 0])
-                            # Middle row - right
-                            ax4 = fig.add_subplot(gs[1, 1])
-                            # Bottom row - left
-                            ax5 = fig.add_subplot(gs[2, 0])
-                            # Leave bottom right empty
-                            
-                            axs = [ax1, ax2, ax3, ax4, ax5]
-                        else:  # 4 graphs
-                            # Equal 2x2 grid with wider graphs
-                            ax1 = fig.add_subplot(gs[0, 0])
-                            ax2 = fig.add_subplot(gs[0, 1])
-                            ax3 = fig.add_subplot(gs[1, 0])
-                            ax4 = fig.add_subplot(gs[1, 1])
-                            
-                            axs = [ax1, ax2, ax3, ax4]
-                    
+                        axs = [fig.add_subplot(111)]
                     else:
-                        # 5-6 graphs - use 3x2 grid with wider aspect ratio
-                        fig = plt.figure(figsize=(12, 11))  # Wider figure to accommodate wider graphs
-                        
                         # Use GridSpec for better control over spacing
-                        from matplotlib.gridspec import GridSpec
-                        # Make width ratios larger than height ratios for wider graphs
-                        gs = GridSpec(3, 2, figure=fig, 
-                                    height_ratios=[1, 1, 1], 
-                                    width_ratios=[1.5, 1.5],  # Wider graphs
-                                    hspace=0.35, wspace=0.25)  # Adjust spacing
-                        
-                        # Only handle 6 graphs case here, since 5 graphs is handled in the elif
-                        # Standard 3x2 grid
-                        ax1 = fig.add_subplot(gs[0, 0])
-                        ax2 = fig.add_subplot(gs[0, 1])
-                        ax3 = fig.add_subplot(gs[1, 0])
-                        ax4 = fig.add_subplot(gs[1, 1])
-                        ax5 = fig.add_subplot(gs[2, 0])
-                        ax6 = fig.add_subplot(gs[2, 1])
-                        
-                        axs = [ax1, ax2, ax3, ax4, ax5, ax6]
+                        gs = GridSpec(figure=fig, **grid_spec)
+                        axs = [fig.add_subplot(gs[row, col]) for row, col in positions]
                     
                     # Copy data from original graphs to the new layout
-                    if graphs_on_page > 1:
-                        for i, graph in enumerate(page_graphs):
-                            selected = graph.get_selected_variables()
-                            title = selected.get('title', f"Graph {start_idx+i+1}")
-                            
-                            # Copy lines, labels, and other elements from original
-                            for line in graph.axes.lines:
-                                axs[i].plot(line.get_xdata(), line.get_ydata(), 
-                                          color=line.get_color(), 
-                                          linestyle=line.get_linestyle(),
-                                          marker=line.get_marker(),
-                                          label=line.get_label())
-                            
-                            axs[i].set_title(title)
-                            axs[i].set_xlabel(graph.axes.get_xlabel())
-                            axs[i].set_ylabel(graph.axes.get_ylabel())
-                            axs[i].grid(True, linestyle='--', alpha=0.7)
-                            
-                            # Add legend if needed
-                            if graph.axes.get_legend() is not None:
-                                axs[i].legend(fontsize='small', framealpha=0.9, loc='best')
+                    for i, (source_axes, title, x_label, y_label, has_legend) in enumerate(page_graphs):
+                        # Copy lines, labels, and other elements from original
+                        self._copy_lines_to_axes(source_axes, axs[i])
+                        
+                        axs[i].set_title(title)
+                        axs[i].set_xlabel(x_label)
+                        axs[i].set_ylabel(y_label)
+                        axs[i].grid(True, linestyle='--', alpha=0.7)
+                        
+                        # Add legend if needed
+                        if has_legend:
+                            axs[i].legend(fontsize='small', framealpha=0.9, loc='best')
                     
-                    # Apply tight_layout with appropriate padding
-                    plt.tight_layout(pad=1.5)
+                    # Apply tight_layout with appropriate padding to this page's figure
+                    fig.tight_layout(pad=1.5)
                     
                     # Save the figure to PDF
                     pdf.savefig(fig)
-                    plt.close(fig)
                 
                 # Add parameter tables after the graphs
                 progress.setLabelText("Adding parameter tables...")
@@ -2027,10 +2548,8 @@ class ResultsTabSuite(QWidget):
                 
                 # Set PDF metadata
                 d = pdf.infodict()
-                d['Title'] = 'Simulation Results'
                 d['Subject'] = 'Graphs from simulation suite'
                 d['Keywords'] = 'matplotlib, simulations, graphs, parameters'
-                d['Creator'] = 'MP Volume Simulator'
             
             debug_print(f"All graphs and parameter tables exported to PDF: {file_path}")
             progress.setValue(100)
@@ -2092,7 +2611,7 @@ class ResultsTabSuite(QWidget):
                     if section_title not in all_parameters:
                         all_parameters[section_title] = {}
                     
-                    for param_name, param_value in params.items():
+                    for param_name, param_value in params:
                         if param_name not in all_parameters[section_title]:
                             all_parameters[section_title][param_name] = {}
                         
@@ -2102,35 +2621,18 @@ class ResultsTabSuite(QWidget):
             progress.setValue(60)
             QApplication.processEvents()
             
-            # Open file and write CSV
+            # Build all rows first: header row with simulation names, then each section's
+            # title row, one row per parameter and a blank row after the section
+            rows = [["Section", "Parameter"] + simulation_names]
+            for section_title, section_params in all_parameters.items():
+                rows.append([section_title, ""])
+                rows.extend(["", param_name] + [values.get(sim_name, "") for sim_name in simulation_names]
+                            for param_name, values in section_params.items())
+                rows.append([])
+            
+            # Open file and write CSV in one call
             with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header row with simulation names
-                header_row = ["Section", "Parameter"]
-                header_row.extend(simulation_names)
-                writer.writerow(header_row)
-                
-                # Write parameters by section
-                for section_title in all_parameters:
-                    # Write section header row
-                    writer.writerow([section_title, ""])
-                    
-                    # Write each parameter in this section
-                    for param_name in all_parameters[section_title]:
-                        row = ["", param_name]
-                        
-                        # Add value for each simulation
-                        for sim_name in simulation_names:
-                            if sim_name in all_parameters[section_title][param_name]:
-                                row.append(all_parameters[section_title][param_name][sim_name])
-                            else:
-                                row.append("")
-                        
-                        writer.writerow(row)
-                    
-                    # Add blank row after section
-                    writer.writerow([])
+                csv.writer(csvfile).writerows(rows)
             
             progress.setValue(100)
             progress.close()
@@ -2335,42 +2837,11 @@ class ResultsTabSuite(QWidget):
                     # Remove any duplicate times from floating point rounding
                     uniform_time_points = np.unique(np.round(uniform_time_points, 10))
                     
-                    # For each time point in our uniform grid, get data from all simulations
-                    for time_point in uniform_time_points:
-                        row = [time_point]  # First add the time value
-                        
-                        for sim_hash, x_data, y_data in sim_data_for_var:
-                            # Skip if time point outside simulation range
-                            if time_point < x_data[0] or time_point > x_data[-1]:
-                                row.append('')
-                                continue
-                            
-                            # Find the closest index
-                            idx = np.abs(x_data - time_point).argmin()
-                            
-                            # If we have an exact match (or close enough)
-                            if abs(x_data[idx] - time_point) < longest_sim_step/10:
-                                row.append(y_data[idx])
-                            else:
-                                # Need to interpolate
-                                if idx > 0 and idx < len(x_data) - 1:
-                                    # Find the bracketing indices
-                                    if x_data[idx] > time_point:
-                                        # Point between idx-1 and idx
-                                        idx_low, idx_high = idx-1, idx
-                                    else:
-                                        # Point between idx and idx+1
-                                        idx_low, idx_high = idx, idx+1
-                                        
-                                    # Linear interpolation
-                                    t = (time_point - x_data[idx_low]) / (x_data[idx_high] - x_data[idx_low])
-                                    interp_value = y_data[idx_low] + t * (y_data[idx_high] - y_data[idx_low])
-                                    row.append(interp_value)
-                                else:
-                                    # Use nearest value if interpolation not possible
-                                    row.append(y_data[idx])
-                        
-                        writer.writerow(row)
+                    # Resample every simulation onto the uniform grid and write the columns in one go,
+                    # leaving cells empty beyond a simulation's duration
+                    columns = [_resample_to_time_points(x_data, y_data, uniform_time_points, longest_sim_step/10)
+                               for _, x_data, y_data in sim_data_for_var]
+                    _write_csv_table(csvfile, uniform_time_points, columns)
             
             # Ensure progress dialog is closed
             progress.setValue(total_progress)
@@ -2559,7 +3030,8 @@ class ResultsTabSuite(QWidget):
                 break
                 
         if time_var is None:
-            debug_print(f"Warning: No time data found for {display_name}")
+            if app_settings.DEBUG_LOGGING:
+                debug_print(f"Warning: No time data found for {display_name}")
             # Create an error page instead of returning empty
             fig, ax = plt.subplots(1, 1, figsize=(8, 6))
             ax.text(0.5, 0.5, f"No time data available for:\n{display_name}\n\nAvailable variables:\n" + 
@@ -2573,7 +3045,8 @@ class ResultsTabSuite(QWidget):
             plt.close(fig)
             return
         
-        debug_print(f"Using time variable: {time_var} for {display_name}")
+        if app_settings.DEBUG_LOGGING:
+            debug_print(f"Using time variable: {time_var} for {display_name}")
         
         # Find the unaccounted ion concentration variable (it could have different prefixes)
         unaccounted_ion_var = None
@@ -3305,7 +3778,7 @@ class ResultsTabSuite(QWidget):
                 
                 if ph_exponent is not None and half_act_ph is not None:
                     # Calculate pH dependency
-                    ph_dep = [1.0 / (1.0 + exp(ph_exponent * (ph - half_act_ph))) for ph in ph_range]
+                    ph_dep = 1.0 / (1.0 + np.exp(ph_exponent * (ph_range - half_act_ph)))
                     
                     # Plot with a color based on the value of the exponent
                     color = 'b' if ph_exponent < 0 else 'r'
@@ -3328,7 +3801,7 @@ class ResultsTabSuite(QWidget):
                 
                 if voltage_exponent is not None and half_act_voltage is not None:
                     # Calculate voltage dependency
-                    voltage_dep = [1.0 / (1.0 + exp(voltage_exponent * (v - half_act_voltage))) for v in voltage_range]
+                    voltage_dep = 1.0 / (1.0 + np.exp(voltage_exponent * (voltage_range - half_act_voltage)))
                     
                     # Plot with appropriate color
                     axs[plot_idx].plot(voltage_range, voltage_dep, 'g-', 
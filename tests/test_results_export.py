@@ -0,0 +1,104 @@
+"""Tests for the CSV export helpers of the suite results tab."""
+import csv
+import io
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+from src.frontend.results_tab_suite import _resample_to_time_points, _write_csv_table
+
+
+def _reference_rows(time_points, lines, tolerance):
+    """Rows as the original per-time-point export loop built them"""
+    rows = []
+    for time_point in time_points:
+        row = [time_point]
+        for x_data, y_data in lines:
+            if time_point < x_data[0] or time_point > x_data[-1]:
+                row.append('')
+                continue
+            idx = np.abs(x_data - time_point).argmin()
+            if abs(x_data[idx] - time_point) < tolerance:
+                row.append(y_data[idx])
+            elif 0 < idx < len(x_data) - 1:
+                idx_low, idx_high = (idx - 1, idx) if x_data[idx] > time_point else (idx, idx + 1)
+                t = (time_point - x_data[idx_low]) / (x_data[idx_high] - x_data[idx_low])
+                row.append(y_data[idx_low] + t * (y_data[idx_high] - y_data[idx_low]))
+            else:
+                row.append(y_data[idx])
+        rows.append(row)
+    return rows
+
+
+def _export(time_points, lines, tolerance, chunk_rows=4):
+    buffer = io.StringIO(newline='')
+    columns = [_resample_to_time_points(x_data, y_data, time_points, tolerance) for x_data, y_data in lines]
+    _write_csv_table(buffer, time_points, columns, chunk_rows=chunk_rows)
+    return buffer.getvalue()
+
+
+def _reference_export(time_points, lines, tolerance):
+    buffer = io.StringIO(newline='')
+    csv.writer(buffer).writerows(_reference_rows(time_points, lines, tolerance))
+    return buffer.getvalue()
+
+
+class TestCsvExport:
+    def test_format(self):
+        """Out-of-range cells are empty, NaN samples are written as 'nan'"""
+        time_points = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+        lines = [(np.array([0.0, 1.0, 2.0]), np.array([1.0, np.nan, 3.0])),
+                 (np.array([0.0, 1.0]), np.array([0.25, 0.75]))]
+        assert _export(time_points, lines, 0.01) == (
+            "0.0,1.0,0.25\r\n"
+            "0.5,1.0,0.25\r\n"
+            "1.0,nan,0.75\r\n"
+            "1.5,nan,\r\n"
+            "2.0,3.0,\r\n")
+
+    def test_matches_row_by_row_export(self):
+        """Chunked output equals the original row-by-row csv.writer output"""
+        rng = np.random.default_rng(0)
+        step = 0.01
+        time_points = np.unique(np.round(np.arange(0.0, 3.0 + step / 2, step), 10))
+        lines = []
+        for end, count in ((3.0, 120), (1.7, 45), (2.2, 400)):
+            x_data = np.linspace(0.0, end, count)
+            y_data = rng.normal(size=count)
+            y_data[count // 3] = np.nan
+            lines.append((x_data, y_data))
+        assert _export(time_points, lines, step / 10, chunk_rows=7) == _reference_export(time_points, lines, step / 10)
+
+    def test_unsorted_x_matches_row_by_row_export(self):
+        """A non-monotonic x variable gets the nearest sample over the whole series, as before"""
+        rng = np.random.default_rng(1)
+        x_data = np.concatenate([np.linspace(0.0, 2.0, 50), np.linspace(1.9, 0.5, 30), np.linspace(0.6, 2.5, 40)])
+        y_data = rng.normal(size=len(x_data))
+        lines = [(x_data, y_data), (np.linspace(0.0, 2.5, 60), rng.normal(size=60))]
+        step = 0.02
+        time_points = np.unique(np.round(np.arange(0.0, 2.5 + step / 2, step), 10))
+        assert _export(time_points, lines, step / 10) == _reference_export(time_points, lines, step / 10)
+
+    def test_integer_data_matches_row_by_row_export(self):
+        """Integer samples are written as integers and only interpolated cells as floats"""
+        time_points = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+        lines = [(np.array([0.0, 1.0, 2.0]), np.array([5, 6, 8])),
+                 (np.array([0.0, 1.0]), np.array([3, 4]))]
+        output = _export(time_points, lines, 0.01)
+        assert output == (
+            "0.0,5,3\r\n"
+            "0.5,5,3\r\n"
+            "1.0,6,4\r\n"
+            "1.5,7.0,\r\n"
+            "2.0,8,\r\n")
+        assert output == _reference_export(time_points, lines, 0.01)
+
+    def test_float32_data_matches_row_by_row_export(self):
+        """float32 samples keep their own formatting next to float64 interpolations"""
+        rng = np.random.default_rng(2)
+        step = 0.01
+        time_points = np.unique(np.round(np.arange(0.0, 2.0 + step / 2, step), 10))
+        lines = [(np.linspace(0.0, 2.0, 70), rng.normal(size=70).astype(np.float32)),
+                 (np.linspace(0.0, 1.2, 500), rng.integers(-5, 5, size=500))]
+        assert _export(time_points, lines, step / 10, chunk_rows=9) == _reference_export(time_points, lines, step / 10)